@@ -1,6 +1,7 @@
 """Logging functions for enhanced terminal output"""
 
 from datetime import datetime
+from typing import Iterable, Tuple
 
 from clingy.core.colors import Colors
 from clingy.core.emojis import Emoji
@@ -47,6 +48,35 @@ def log_info(message: str):
     print(f"{Colors.CYAN}{Emoji.INFO} [{timestamp}] {message}{Colors.RESET}")
 
 
+# Color and emoji per level, as used by log_success/log_error/log_warning/log_info
+_LEVEL_STYLES = {
+    "success": (Colors.GREEN, Emoji.SUCCESS),
+    "error": (Colors.RED, Emoji.ERROR),
+    "warning": (Colors.YELLOW, Emoji.WARNING),
+    "info": (Colors.CYAN, Emoji.INFO),
+}
+
+
+def log_lines(entries: Iterable[Tuple[str, str]]):
+    """
+    Log several lines with a single write
+
+    Each line looks exactly like the matching log_success/log_error/
+    log_warning/log_info call, but the whole batch is formatted with one
+    timestamp and printed at once (for long listings).
+
+    Args:
+        entries: (level, message) pairs; level is "success", "error", "warning" or "info"
+    """
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    lines = []
+    for level, message in entries:
+        color, emoji = _LEVEL_STYLES[level]
+        lines.append(f"{color}{emoji} [{timestamp}] {message}{Colors.RESET}")
+    if lines:
+        print("\n".join(lines))
+
+
 def print_summary():
     """Print final summary with statistics"""
     total_time = stats.get_duration()
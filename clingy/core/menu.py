@@ -6,11 +6,26 @@ Uses fzf for fuzzy finding and selection.
 """
 
 # Standard library
+import functools
+import os
+import shutil
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 # Local
 from clingy.core.colors import Colors
@@ -226,6 +241,68 @@ def fzf_select(
         log_error("No options provided to fzf")
         return None
 
+    return _run_fzf(options, prompt=prompt, header=header, multi=multi)
+
+
+@functools.lru_cache(maxsize=1)
+def _fzf_executable() -> str:
+    """
+    Resolve the absolute path of fzf once per process.
+
+    Returns:
+        Absolute path to fzf
+
+    Raises:
+        FileNotFoundError: If fzf is not installed
+    """
+    path = shutil.which("fzf")
+    if path is None:
+        raise FileNotFoundError("fzf")
+    return os.path.abspath(path)
+
+
+def _feed_fzf(stdin: IO[bytes], input_data: Union[bytes, Iterable[str]]) -> None:
+    """
+    Write options to fzf's stdin (runs in a background thread).
+
+    fzf starts drawing as soon as the first lines arrive, so options are
+    written as they are produced instead of being joined up front.
+
+    Args:
+        stdin: fzf's stdin pipe (closed when done)
+        input_data: Pre-encoded newline-separated options, or an iterable of options
+    """
+    try:
+        if isinstance(input_data, bytes):
+            stdin.write(input_data)
+        else:
+            for option in input_data:
+                stdin.write(option.encode() + b"\n")
+        stdin.close()
+    except (BrokenPipeError, ValueError):
+        # fzf exited (selection made or cancelled) before reading everything
+        pass
+
+
+def _run_fzf(
+    input_data: Union[bytes, Iterable[str]],
+    prompt: str = "Select: ",
+    header: str = "",
+    multi: bool = False,
+) -> Optional[List[str]]:
+    """
+    Run fzf over options streamed to its stdin.
+
+    Args:
+        input_data: Options joined with newlines and encoded as UTF-8, or an
+            iterable of options (e.g., a generator) written line by line
+        prompt: Prompt text
+        header: Header for fzf
+        multi: Enable multi-selection
+
+    Returns:
+        List of selected options or None if cancelled
+    """
     # Build fzf command
     cmd = [
         "fzf",
@@ -244,26 +321,35 @@ def fzf_select(
     if multi:
         cmd.append("--multi")
 
-    # Prepare input
-    input_data = "\n".join(options)
-
     try:
-        result = subprocess.run(
+        cmd[0] = _fzf_executable()
+
+        # Absolute path + close_fds=False lets CPython start fzf with posix_spawn
+        # instead of fork/exec (no copy-on-write snapshot of a large interpreter
+        # heap). Python's own descriptors are non-inheritable, so none leak.
+        proc = subprocess.Popen(
             cmd,
-            input=input_data,
-            text=True,
-            capture_output=True,
-            check=False,  # No raise on non-zero exit
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
+        writer = threading.Thread(target=_feed_fzf, args=(proc.stdin, input_data), daemon=True)
+        writer.start()
+
+        try:
+            output = proc.stdout.read()
+        finally:
+            returncode = proc.wait()
 
         # Exit code 0: successful selection
         # Any other code: cancelled (ESC/Ctrl+C) or error
-        if result.returncode != 0:
+        if returncode != 0:
             # User cancelled or error - return None
             return None
 
         # Parse output
-        selected = result.stdout.strip()
+        selected = output.decode().strip()
         if not selected:
             return None
 
@@ -281,6 +367,34 @@ def fzf_select(
         return None
 
 
+@functools.lru_cache(maxsize=16)
+def _items_candidates(items: Tuple[str, ...], include_all: bool) -> Tuple[bytes, FrozenSet[str]]:
+    """
+    Encode the fzf input for an item list once and cache it.
+
+    Menus re-open the same picker (e.g., the functions list) many times per
+    session; the joined/encoded payload and the lookup set only depend on the
+    items, so they are built on first use and reused afterwards.
+
+    Args:
+        items: Items to select from (tuple so it can be a cache key)
+        include_all: Whether to prepend the [ALL ITEMS] option
+
+    Returns:
+        Tuple of (fzf input bytes, set of valid items)
+    """
+    options = []
+
+    # Add "All" option at the beginning
+    if include_all:
+        options.append(f"{Colors.BOLD}{Colors.GREEN}{Emoji.ALL} All{Colors.RESET}")
+
+    # Add individual items
+    options.extend(items)
+
+    return "\n".join(options).encode(), frozenset(items)
+
+
 def fzf_select_items(
     items: Optional[List[str]] = None,
     prompt: str = "Select items: ",
@@ -315,18 +429,11 @@ def fzf_select_items(
     if not items:
         return None
 
-    options = []
     all_items_label = f"{Emoji.ALL} All"
-
-    # Add "All" option at the beginning
-    if include_all:
-        options.append(f"{Colors.BOLD}{Colors.GREEN}{all_items_label}{Colors.RESET}")
-
-    # Add individual items
-    options.extend(items)
+    input_data, valid_items = _items_candidates(tuple(items), include_all)
 
     # Execute fzf with multi-selection
-    selected = fzf_select(options, prompt=prompt, header="Use TAB to select multiple", multi=True)
+    selected = _run_fzf(input_data, prompt=prompt, header="Use TAB to select multiple", multi=True)
 
     if not selected:
         return None
@@ -340,7 +447,7 @@ def fzf_select_items(
     for s in selected:
         # Remove ANSI codes for comparison
         clean = s.replace(Colors.BOLD, "").replace(Colors.GREEN, "").replace(Colors.RESET, "")
-        if clean in items:
+        if clean in valid_items:
             filtered.append(clean)
 
     return filtered if filtered else None
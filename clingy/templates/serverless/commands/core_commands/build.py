@@ -2,11 +2,20 @@
 
 import os
 import subprocess
+import threading
 import time
 from argparse import ArgumentParser, Namespace
-from typing import List, Optional
-
-from config import BIN_DIR, BUILD_FLAGS, BUILD_SETTINGS, FUNCTIONS_DIR, GO_FUNCTIONS
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, NamedTuple, Optional
+
+from config import (
+    BIN_DIR,
+    BUILD_FLAGS,
+    BUILD_SETTINGS,
+    FUNCTIONS_DIR,
+    GO_FUNCTIONS,
+    PROJECT_ROOT,
+)
 from core.function_utils import resolve_function_list
 from core.subprocess_helper import run_in_project_root
 
@@ -25,6 +34,17 @@ from clingy.core.menu import MenuNode
 from clingy.core.stats import stats
 
 
+class _BuildResult(NamedTuple):
+    """Outcome of compiling a single function"""
+
+    func_name: str
+    success: bool
+    duration: float
+    message: str
+    detail: str = ""
+    go_missing: bool = False
+
+
 class BuildCommand(BaseCommand):
     """Build Go functions to binaries"""
 
@@ -35,6 +55,7 @@ class BuildCommand(BaseCommand):
   manager.py build                 # Build all functions
   manager.py build -f status       # Build only the status function
   manager.py build -f getClientes  # Build only getClientes function
+  manager.py build --keep-going    # Build everything even if some builds fail
 """
 
     def add_arguments(self, parser: ArgumentParser):
@@ -45,6 +66,11 @@ class BuildCommand(BaseCommand):
             type=str,
             help="Specific function name to build (e.g., status, getClientes)",
         )
+        parser.add_argument(
+            "--keep-going",
+            action="store_true",
+            help="Keep building the remaining functions after a build fails (default: stop)",
+        )
 
     def execute(self, args: Namespace) -> bool:
         """Execute build command"""
@@ -60,7 +86,8 @@ class BuildCommand(BaseCommand):
         stats.total_functions = len(functions_to_build)
 
         # Build functions
-        success = self._build_functions(functions_to_build)
+        fail_fast = not getattr(args, "keep_going", False)
+        success = self._build_functions(functions_to_build, fail_fast)
 
         # Print summary
         print_summary()
@@ -70,28 +97,150 @@ class BuildCommand(BaseCommand):
     def get_menu_tree(self) -> MenuNode:
         return super().get_menu_tree()
 
-    def _validate_function_exists(self, func_name: str) -> bool:
+    def prepare_build(self, workers: int) -> Dict[str, str]:
+        """
+        One-time setup before running `workers` builds concurrently
+
+        Downloads the module graph once (so parallel builds don't race to
+        resolve and fetch the same modules into GOMODCACHE) and splits the
+        compiler's own package parallelism (-p) across the workers so N
+        concurrent builds don't each try to use every core.
+
+        Args:
+            workers: Number of builds that will run at the same time
+
+        Returns:
+            Environment to pass to each go build
+        """
+        env = os.environ.copy()
+        env.update(BUILD_SETTINGS)
+
+        if workers > 1:
+            self._download_modules()
+            per_build = max(1, (os.cpu_count() or 1) // workers)
+            env["GOFLAGS"] = f"{env.get('GOFLAGS', '')} -p={per_build}".strip()
+
+        return env
+
+    def _download_modules(self) -> None:
+        """Warm the Go module cache with a single 'go mod download'"""
+        if not os.path.exists(os.path.join(PROJECT_ROOT, "go.mod")):
+            return
+
+        try:
+            run_in_project_root(
+                ["go", "mod", "download"], check=True, capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            pass  # Reported per function by the builds themselves
+        except subprocess.CalledProcessError as e:
+            log_warning(f"'go mod download' failed: {(e.stderr or '').strip()}")
+
+    def build_one(
+        self,
+        func_name: str,
+        abort: Optional[threading.Event] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> Optional[_BuildResult]:
         """
-        Validate that main.go exists for the function
+        Compile a single function (runs in a worker thread, no logging)
 
         Args:
-            func_name: Function name
+            func_name: Function name to build
+            abort: Set by the caller to skip builds that have not started yet
+            env: Build environment from prepare_build (None prepares a single build)
 
         Returns:
-            True if main.go exists, False otherwise
+            _BuildResult describing the outcome, or None if skipped by abort
         """
+        if abort is not None and abort.is_set():
+            return None
+
+        start_time = time.time()
+
+        # Validate source file exists
         main_go_path = os.path.join(FUNCTIONS_DIR, func_name, "main.go")
         if not os.path.exists(main_go_path):
-            log_warning(f"File {main_go_path} not found for function '{func_name}'")
-            return False
-        return True
-
-    def _build_functions(self, functions_to_build: List[str]) -> bool:
+            return _BuildResult(
+                func_name,
+                False,
+                time.time() - start_time,
+                f"File {main_go_path} not found for function '{func_name}'",
+            )
+
+        source_dir = os.path.abspath(os.path.join(FUNCTIONS_DIR, func_name))
+        go_file = os.path.join(source_dir, "main.go")
+        output_dir = os.path.abspath(os.path.join(BIN_DIR, func_name))
+        bootstrap_file = os.path.join(output_dir, "bootstrap")
+
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Configure environment for cross-platform compilation
+        if env is None:
+            env = self.prepare_build(1)
+
+        # Build command
+        command = ["go", "build"] + BUILD_FLAGS + ["-o", bootstrap_file, go_file]
+
+        try:
+            result = run_in_project_root(
+                command,
+                check=True,
+                capture_output=True,
+                text=True,
+                env=env,
+                cwd=source_dir,
+            )
+        except subprocess.CalledProcessError as e:
+            return _BuildResult(
+                func_name,
+                False,
+                time.time() - start_time,
+                f"{func_name} → compilation failed",
+                (e.stderr or "").strip(),
+            )
+        except FileNotFoundError:
+            return _BuildResult(
+                func_name,
+                False,
+                time.time() - start_time,
+                "Go is not installed or not found in PATH",
+                go_missing=True,
+            )
+
+        duration = time.time() - start_time
+
+        if result.returncode != 0:
+            return _BuildResult(
+                func_name,
+                False,
+                duration,
+                f"{func_name} → exit code {result.returncode}",
+                (result.stderr or "").strip(),
+            )
+
+        # Verify file was created correctly
+        try:
+            file_size = os.stat(bootstrap_file).st_size
+        except FileNotFoundError:
+            return _BuildResult(
+                func_name, False, duration, f"{func_name} → bootstrap file not found"
+            )
+
+        return _BuildResult(func_name, True, duration, f"{func_name} → {file_size:,} bytes")
+
+    def _build_functions(self, functions_to_build: List[str], fail_fast: bool = True) -> bool:
         """
-        Build Go functions with enhanced logging and filtering
+        Build Go functions in parallel with enhanced logging and filtering
+
+        Each 'go build' runs in a worker thread (the compiler is a separate
+        process, so threads are enough); results are logged from the main
+        thread as they complete so output lines never interleave.
 
         Args:
             functions_to_build: List of function names to build
+            fail_fast: Stop starting new builds after the first failure
 
         Returns:
             True if all builds succeeded, False otherwise
@@ -99,76 +248,48 @@ class BuildCommand(BaseCommand):
         log_section(f"BUILDING {len(functions_to_build)} GO FUNCTIONS")
 
         overall_success = True
+        total = len(functions_to_build)
+        max_workers = min(os.cpu_count() or 4, total)
+        abort = threading.Event()
+        skipped = []
+        env = self.prepare_build(max_workers)
 
-        for i, func_name in enumerate(functions_to_build, 1):
-            log_info(f"Processing function {i}/{len(functions_to_build)}: {func_name}")
-            start_time = time.time()
-
-            # Validate source file exists
-            if not self._validate_function_exists(func_name):
-                stats.add_failure(func_name)
-                overall_success = False
-                continue
-
-            source_dir = os.path.abspath(os.path.join(FUNCTIONS_DIR, func_name))
-            go_file = os.path.join(source_dir, "main.go")
-            output_dir = os.path.abspath(os.path.join(BIN_DIR, func_name))
-            bootstrap_file = os.path.join(output_dir, "bootstrap")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.build_one, f, abort, env): f for f in functions_to_build
+            }
 
-            # Create output directory if it doesn't exist
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                log_info(f"Directory created: {output_dir}")
-
-            # Configure environment for cross-platform compilation
-            env = os.environ.copy()
-            env.update(BUILD_SETTINGS)
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    func_name = futures[future]
+                    result = future.result()
+                    if result is None:
+                        skipped.append(func_name)
+                        stats.add_failure(func_name)
+                        continue
 
-            # Build command
-            command = ["go", "build"] + BUILD_FLAGS + ["-o", bootstrap_file, go_file]
+                    log_info(f"Finished function {i}/{total}: {func_name}")
 
-            try:
-                result = run_in_project_root(
-                    command,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    cwd=source_dir,
-                )
-
-                duration = time.time() - start_time
-
-                if result.returncode == 0:
-                    # Verify file was created correctly
-                    if os.path.exists(bootstrap_file):
-                        file_size = os.path.getsize(bootstrap_file)
-                        log_success(f"{func_name} → {file_size:,} bytes", duration)
+                    if result.success:
+                        log_success(result.message, result.duration)
                         stats.add_success()
-                    else:
-                        log_error(f"{func_name} → bootstrap file not found", duration)
-                        stats.add_failure(func_name)
-                        overall_success = False
-                else:
-                    log_error(f"{func_name} → exit code {result.returncode}", duration)
-                    if result.stderr:
-                        print(f"  {Colors.RED}Error: {result.stderr.strip()}{Colors.RESET}")
+                        continue
+
+                    log_error(result.message, result.duration)
+                    if result.detail:
+                        print(f"  {Colors.RED}Error: {result.detail}{Colors.RESET}")
                     stats.add_failure(func_name)
                     overall_success = False
 
-            except subprocess.CalledProcessError as e:
-                duration = time.time() - start_time
-                log_error(f"{func_name} → compilation failed", duration)
-                if e.stderr:
-                    print(f"  {Colors.RED}Error: {e.stderr.strip()}{Colors.RESET}")
-                stats.add_failure(func_name)
-                overall_success = False
-
-            except FileNotFoundError:
-                duration = time.time() - start_time
-                log_error("Go is not installed or not found in PATH", duration)
-                stats.add_failure(func_name)
-                overall_success = False
-                break  # If Go is not available, don't try more functions
+                    # If Go is not available, don't try more functions
+                    if fail_fast or result.go_missing:
+                        abort.set()
+            except KeyboardInterrupt:
+                # Don't let queued builds start while the pool drains
+                abort.set()
+                raise
+
+        if skipped:
+            log_warning(f"Skipped {len(skipped)} function(s) after a failed build")
 
         return overall_success
@@ -1,25 +1,37 @@
 """Deploy stack to AWS"""
 
+import base64
+import hashlib
 import os
 import subprocess
+import threading
 import time
 from argparse import ArgumentParser, Namespace
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, NamedTuple, Optional
 
 # Import build and zip commands for --all flag
 from commands.core_commands.build import BuildCommand
 from commands.core_commands.zip import ZipCommand
 from config import (
     BIN_DIR,
+    DEPLOY_FUNCTION_METHOD,
     GO_FUNCTIONS,
+    INVOKE_AWS_REGION,
     PROJECT_ROOT,
     SERVERLESS_PROFILE,
     SERVERLESS_STAGE,
 )
-from core.function_utils import resolve_function_list
+from core.function_utils import (
+    GO_FUNCTIONS_SET,
+    FunctionArgs,
+    build_lambda_name,
+    resolve_function_list,
+)
 from core.subprocess_helper import run_in_project_root
 
 from clingy.commands.base import BaseCommand
+from clingy.core.colors import Colors
 from clingy.core.logger import (
     log_error,
     log_header,
@@ -32,6 +44,42 @@ from clingy.core.logger import (
 from clingy.core.menu import MenuNode
 from clingy.core.stats import stats
 
+# Upper bound on concurrent single-function deploys (network-bound); also the
+# size of the shared Lambda client's connection pool so no worker waits on it
+MAX_DEPLOY_WORKERS = 16
+
+
+def deploy_workers(total: int) -> int:
+    """
+    Number of single-function deploys to run at once
+
+    Only the boto3 method runs deploys concurrently: it shares one thread-safe
+    Lambda client sized for MAX_DEPLOY_WORKERS. Concurrent 'serverless deploy
+    function' runs share the project's .serverless/ state, which the Serverless
+    Framework does not support, so they run one at a time.
+
+    Args:
+        total: Number of functions to deploy
+
+    Returns:
+        Worker count (at least 1)
+    """
+    if DEPLOY_FUNCTION_METHOD == "boto3":
+        return min(MAX_DEPLOY_WORKERS, total) or 1
+    return 1
+
+
+class _DeployResult(NamedTuple):
+    """Outcome of deploying a single function"""
+
+    func_name: str
+    success: bool
+    duration: float
+    message: str
+    detail: str = ""
+    tool_missing: bool = False
+    skipped: bool = False
+
 
 class DeployCommand(BaseCommand):
     """Deploy serverless stack to AWS"""
@@ -45,6 +93,8 @@ class DeployCommand(BaseCommand):
   manager.py deploy --debug            # Deploy with debug output
   manager.py deploy --all              # Build, zip, and deploy all functions
   manager.py deploy --all -f status    # Build, zip, and deploy only status function
+  manager.py deploy --keep-going       # Keep deploying the others after a failure
+  manager.py deploy -f status --force  # Upload even if AWS already runs this zip (boto3)
 """
 
     def add_arguments(self, parser: ArgumentParser):
@@ -57,6 +107,24 @@ class DeployCommand(BaseCommand):
             type=str,
             help="Specific function name to deploy (standalone) or build/zip/deploy (with --all)",
         )
+        parser.add_argument(
+            "--keep-going",
+            action="store_true",
+            help="Keep deploying the remaining functions after a failure (default: stop)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Upload code even if it matches the deployed code (boto3 deploy method)",
+        )
+
+    def __init__(self, lambda_client: Any = None):
+        """
+        Args:
+            lambda_client: boto3 Lambda client to reuse for boto3 deploys
+                (None uses the process-wide cached client on first use)
+        """
+        self._lambda_client = lambda_client
 
     def execute(self, args: Namespace) -> bool:
         """Execute deploy command"""
@@ -69,9 +137,10 @@ class DeployCommand(BaseCommand):
         if not functions:
             return False
 
-        # Check debug flag (may not exist in interactive mode)
+        # Check debug/keep-going/force flags (may not exist in interactive mode)
         debug = getattr(args, "debug", False)
-        return self._deploy(debug, functions)
+        fail_fast = not getattr(args, "keep_going", False)
+        return self._deploy(debug, functions, fail_fast, getattr(args, "force", False))
 
     def get_menu_tree(self) -> MenuNode:
         return super().get_menu_tree()
@@ -85,21 +154,23 @@ class DeployCommand(BaseCommand):
         if not functions:
             return False
 
+        # Build and zip read the same immutable args object
+        keep_going = getattr(args, "keep_going", False)
+        step_args = FunctionArgs(function_list=functions, keep_going=keep_going)
+
         # Step 1: Build
         log_section("STEP 1: BUILDING")
         build_cmd = BuildCommand()
-        build_args = Namespace(function=args.function, function_list=functions)
 
-        if not build_cmd.execute(build_args):
+        if not build_cmd.execute(step_args):
             log_error("Build failed. Stopping pipeline.")
             return False
 
         # Step 2: Zip
         log_section("STEP 2: COMPRESSING")
         zip_cmd = ZipCommand()
-        zip_args = Namespace(function=args.function, function_list=functions)
 
-        if not zip_cmd.execute(zip_args):
+        if not zip_cmd.execute(step_args):
             log_error("Compression failed. Stopping pipeline.")
             return False
 
@@ -109,7 +180,8 @@ class DeployCommand(BaseCommand):
         # Step 3: Deploy
         log_section("STEP 3: DEPLOYING")
         debug = getattr(args, "debug", False)
-        if not self._deploy(debug, functions):
+        force = getattr(args, "force", False)
+        if not self._deploy(debug, functions, not keep_going, force):
             log_error("Deployment failed.")
             return False
 
@@ -127,7 +199,7 @@ class DeployCommand(BaseCommand):
             True if valid, False otherwise
         """
         # Check if function exists in GO_FUNCTIONS
-        if func_name not in GO_FUNCTIONS:
+        if func_name not in GO_FUNCTIONS_SET:
             log_error(f"Function '{func_name}' not found in GO_FUNCTIONS list")
             log_info(
                 f"Available functions: {', '.join(GO_FUNCTIONS[:5])}{'...' if len(GO_FUNCTIONS) > 5 else ''}"
@@ -143,7 +215,13 @@ class DeployCommand(BaseCommand):
 
         return True
 
-    def _deploy(self, debug: bool = False, functions: Optional[List[str]] = None) -> bool:
+    def _deploy(
+        self,
+        debug: bool = False,
+        functions: Optional[List[str]] = None,
+        fail_fast: bool = True,
+        force: bool = False,
+    ) -> bool:
         """
         Execute the actual deployment with smart strategy selection.
 
@@ -155,6 +233,8 @@ class DeployCommand(BaseCommand):
         Args:
             debug: Enable debug mode
             functions: List of function names to deploy (None = full stack)
+            fail_fast: Stop starting new per-function deploys after a failure
+            force: Upload code even if it matches the deployed code (boto3 method)
 
         Returns:
             True if deployment succeeded
@@ -165,18 +245,19 @@ class DeployCommand(BaseCommand):
             return self._deploy_full_stack(debug)
         elif len(functions) == 1:
             # Single function deployment (fast, code only)
-            return self._deploy_single_function(debug, functions[0])
+            return self._deploy_single_function(debug, functions[0], force)
         else:
             # Multiple (but not all) functions - deploy each individually
-            return self._deploy_multiple_functions(debug, functions)
+            return self._deploy_multiple_functions(debug, functions, fail_fast, force)
 
-    def _deploy_single_function(self, debug: bool, function_name: str) -> bool:
+    def _deploy_single_function(self, debug: bool, function_name: str, force: bool = False) -> bool:
         """
         Deploy a single function (fast, code only).
 
         Args:
             debug: Enable debug mode
             function_name: Function name to deploy
+            force: Upload code even if it matches the deployed code (boto3 method)
 
         Returns:
             True if deployment succeeded
@@ -190,6 +271,22 @@ class DeployCommand(BaseCommand):
             f"DEPLOYING {function_name} (stage: {SERVERLESS_STAGE}, profile: {SERVERLESS_PROFILE})"
         )
 
+        if DEPLOY_FUNCTION_METHOD == "boto3":
+            result = self._update_function_code(function_name, force)
+            if result.skipped:
+                log_success(f"Function '{function_name}' is up-to-date (deployed code matches zip)")
+                log_info("Use --force to upload anyway")
+                return True
+            if result.success:
+                log_success(
+                    f"Function '{function_name}' deployed successfully to AWS", result.duration
+                )
+                return True
+            log_error(result.message, result.duration)
+            if result.detail:
+                log_info(result.detail)
+            return False
+
         # Build serverless deploy function command
         command = [
             "serverless",
@@ -287,13 +384,181 @@ class DeployCommand(BaseCommand):
             log_info("Install with: npm install -g serverless")
             return False
 
-    def _deploy_multiple_functions(self, debug: bool, functions: List[str]) -> bool:
+    def _get_lambda_client(self) -> Any:
+        """
+        Get the Lambda client shared by every boto3 deploy
+
+        Returns:
+            boto3 Lambda client with one pooled connection per deploy worker
+
+        Raises:
+            ImportError: If boto3 is not installed
+        """
+        if self._lambda_client is None:
+            from core.aws_clients import get_client
+
+            # Adaptive retries back off on throttling when many deploys run at once
+            self._lambda_client = get_client(
+                "lambda",
+                INVOKE_AWS_REGION,
+                max_pool_connections=MAX_DEPLOY_WORKERS,
+                retry_mode="adaptive",
+                total_max_attempts=8,
+            )
+        return self._lambda_client
+
+    def _deployed_code_matches(self, client: Any, lambda_name: str, zip_bytes: bytes) -> bool:
+        """
+        Check whether AWS already runs exactly this zip
+
+        Lambda reports the deployed package as base64(SHA256(zip)) in CodeSha256,
+        so deploys made from CI, another machine or the console are seen too.
+
+        Args:
+            client: boto3 Lambda client
+            lambda_name: Full Lambda function name
+            zip_bytes: Contents of the zip about to be uploaded
+
+        Returns:
+            True if the deployed code matches; False if it differs or is unknown
+        """
+        code_sha256 = base64.b64encode(hashlib.sha256(zip_bytes).digest()).decode("ascii")
+        try:
+            configuration = client.get_function_configuration(FunctionName=lambda_name)
+        except Exception:
+            # e.g. function not created yet: let UpdateFunctionCode report it
+            return False
+        return configuration.get("CodeSha256") == code_sha256
+
+    def _update_function_code(self, function_name: str, force: bool = False) -> _DeployResult:
+        """
+        Upload a function's built zip with UpdateFunctionCode (boto3 deploy method)
+
+        One Lambda client is shared by every call (and every worker thread), so
+        credentials are resolved and HTTPS connections opened once per session
+        instead of once per function. The upload is skipped when the deployed
+        code already matches the zip.
+
+        Args:
+            function_name: Function name to deploy
+            force: Upload even if the deployed code matches the zip
+
+        Returns:
+            _DeployResult describing the outcome
+        """
+        start_time = time.time()
+        zip_path = os.path.join(BIN_DIR, function_name, f"{function_name}.zip")
+        lambda_name = build_lambda_name(function_name)
+
+        try:
+            client = self._get_lambda_client()
+
+            with open(zip_path, "rb") as f:
+                zip_bytes = f.read()
+
+            if not force and self._deployed_code_matches(client, lambda_name, zip_bytes):
+                return _DeployResult(
+                    function_name,
+                    True,
+                    time.time() - start_time,
+                    f"{function_name} → up-to-date (skipped)",
+                    skipped=True,
+                )
+
+            client.update_function_code(FunctionName=lambda_name, ZipFile=zip_bytes)
+        except ImportError as e:
+            return _DeployResult(
+                function_name, False, time.time() - start_time, str(e), tool_missing=True
+            )
+        except Exception as e:
+            return _DeployResult(
+                function_name,
+                False,
+                time.time() - start_time,
+                f"{function_name} → deployment failed",
+                str(e),
+            )
+
+        return _DeployResult(
+            function_name, True, time.time() - start_time, f"{function_name} → deployed"
+        )
+
+    def deploy_one(self, debug: bool, function_name: str, force: bool = False) -> _DeployResult:
+        """
+        Deploy a single function's code (runs in a worker thread, no logging)
+
+        Output is captured so deployments running alongside builds, zips or
+        other deploys don't interleave on the terminal; it is shown only when
+        the deployment fails.
+
+        Args:
+            debug: Enable debug mode
+            function_name: Function name to deploy
+            force: Upload even if the deployed code matches the zip (boto3 method;
+                'serverless deploy function' also pushes configuration, so it always runs)
+
+        Returns:
+            _DeployResult describing the outcome
+        """
+        if DEPLOY_FUNCTION_METHOD == "boto3":
+            return self._update_function_code(function_name, force)
+
+        command = [
+            "serverless",
+            "deploy",
+            "function",
+            "-f",
+            function_name,
+            "--stage",
+            SERVERLESS_STAGE,
+            "--aws-profile",
+            SERVERLESS_PROFILE,
+        ]
+        if debug:
+            command.append("--debug")
+
+        start_time = time.time()
+
+        try:
+            result = run_in_project_root(command, check=False, capture_output=True, text=True)
+        except FileNotFoundError:
+            return _DeployResult(
+                function_name,
+                False,
+                time.time() - start_time,
+                "Serverless Framework is not installed or not found in PATH",
+                "Install with: npm install -g serverless",
+                tool_missing=True,
+            )
+
+        duration = time.time() - start_time
+
+        if result.returncode != 0:
+            return _DeployResult(
+                function_name,
+                False,
+                duration,
+                f"{function_name} → deployment failed with code {result.returncode}",
+                (result.stderr or result.stdout or "").strip(),
+            )
+
+        return _DeployResult(function_name, True, duration, f"{function_name} → deployed")
+
+    def _deploy_multiple_functions(
+        self, debug: bool, functions: List[str], fail_fast: bool = True, force: bool = False
+    ) -> bool:
         """
         Deploy multiple functions individually (not all functions).
 
+        Deployments run in a thread pool sized by deploy_workers() (concurrent
+        for boto3, one at a time for serverless); results are logged from the
+        main thread as they complete.
+
         Args:
             debug: Enable debug mode
             functions: List of function names to deploy
+            fail_fast: After the first failure, skip deploys that haven't started
+            force: Upload code even if it matches the deployed code (boto3 method)
 
         Returns:
             True if all deployments succeeded
@@ -302,18 +567,68 @@ class DeployCommand(BaseCommand):
         log_info(f"Deploying functions individually: {', '.join(functions)}")
         log_info("Note: This only updates function code, not infrastructure/endpoints")
 
-        success_count = 0
-        failed_functions = []
+        # Validate up front so nothing is deployed against a missing zip
+        failed_functions = [func for func in functions if not self._validate_function(func)]
+        if failed_functions and fail_fast:
+            log_error("Validation failed, nothing deployed (use --keep-going to deploy the rest)")
+            return False
+        pending = [func for func in functions if func not in failed_functions]
+        if debug:
+            log_info("Debug mode enabled for deployment")
 
-        for func in functions:
-            if self._deploy_single_function(debug, func):
-                success_count += 1
-            else:
-                failed_functions.append(func)
+        # Create the shared client here so the workers never race to create it
+        if DEPLOY_FUNCTION_METHOD == "boto3" and pending:
+            try:
+                self._get_lambda_client()
+            except ImportError as e:
+                log_error(str(e))
+                return False
 
-            # Add spacing between function deployments
-            if func != functions[-1]:
-                print()
+        success_count = 0
+        skipped = []
+        total = len(pending)
+        max_workers = deploy_workers(total)
+        abort = threading.Event()
+
+        def run(func: str) -> Optional[_DeployResult]:
+            # Queued deploys check the abort flag before starting
+            if abort.is_set():
+                return None
+            return self.deploy_one(debug, func, force)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run, f): f for f in pending}
+
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    func = futures[future]
+                    result = future.result()
+                    if result is None:
+                        skipped.append(func)
+                        failed_functions.append(func)
+                        continue
+
+                    log_info(f"Finished function {i}/{total}: {func}")
+
+                    if result.success:
+                        log_success(result.message, result.duration)
+                        success_count += 1
+                        continue
+
+                    log_error(result.message, result.duration)
+                    if result.detail:
+                        print(f"  {Colors.RED}{result.detail}{Colors.RESET}")
+                    failed_functions.append(func)
+
+                    if fail_fast or result.tool_missing:
+                        abort.set()
+            except KeyboardInterrupt:
+                # Don't let queued deploys start while the pool drains
+                abort.set()
+                raise
+
+        if skipped:
+            log_warning(f"Skipped {len(skipped)} function(s) after a failed deploy")
 
         # Summary
         print()
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from config import AWS_PROFILE, GO_FUNCTIONS, SERVERLESS_STAGE, SERVICE_NAME
+from core.function_utils import GO_FUNCTIONS_SET
 from core.insights_formatter import (
     format_results_table,
     save_results_csv,
@@ -64,7 +65,7 @@ class InsightsCommand(BaseCommand):
         """Execute insights command"""
         # If function is pre-selected (from dev menu), skip to action menu
         if hasattr(args, "function") and args.function:
-            if args.function in GO_FUNCTIONS:
+            if args.function in GO_FUNCTIONS_SET:
                 return self._show_action_menu([args.function]) or True
             else:
                 log_error(f"Function '{args.function}' not found in available functions")
@@ -1,21 +1,25 @@
 """Interactive invoke menu for Lambda functions"""
 
-import glob
+import base64
+import functools
+import io
 import json
 import os
 import subprocess
-import time
+import sys
+import tempfile
 from argparse import ArgumentParser, Namespace
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from clingy.core.menu import MenuNode
 
 try:
-    import yaml
+    import orjson
 
-    YAML_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    YAML_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 from config import (
     AWS_PROFILE,
@@ -27,10 +31,8 @@ from config import (
     PAYLOAD_SHOW_MERGE_SOURCES,
     PAYLOADS_DIR,
     SERVERLESS_STAGE,
-    SERVICE_NAME,
 )
-from core.payload_composer import ComposedPayload, PayloadComposer, PayloadError
-from core.payload_navigator import PayloadNavigator
+from core.function_utils import GO_FUNCTIONS_SET, build_lambda_name
 from core.subprocess_helper import run_in_project_root
 
 from clingy.commands.base import BaseCommand
@@ -44,6 +46,51 @@ from clingy.core.logger import (
     log_warning,
 )
 
+if TYPE_CHECKING:
+    from core.payload_composer import ComposedPayload, PayloadComposer
+
+# Pre-encoded fzf input for the function picker (GO_FUNCTIONS is static per session)
+_GO_FUNCTIONS_INPUT = "\n".join(GO_FUNCTIONS).encode()
+
+# Synchronous invokes wait up to Lambda's maximum timeout (900s) plus headroom;
+# botocore's default 60s read timeout would cut long runs short
+_INVOKE_READ_TIMEOUT = 910
+
+
+def _build_menu(entries: List[Tuple[str, Tuple[str, str]]]) -> Tuple[bytes, Dict]:
+    """Precompute fzf input and label -> (action, invocation_type) map for a static menu"""
+    text = "\n".join(label for label, _ in entries).encode()
+    # fzf output is stripped, so key on stripped labels
+    return text, {label.strip(): value for label, value in entries}
+
+
+# Invoke option menus (static; async "fire-and-forget" variants only apply remotely)
+_INVOKE_MENU_ENTRIES = [
+    (f"{Emoji.MONITOR_IN} Invoke without payload", ("no-payload", "RequestResponse")),
+    (f"{Emoji.PENCIL} Compose payload and invoke", ("compose", "RequestResponse")),
+]
+_INVOKE_ASYNC_MENU_ENTRIES = [
+    (f"{Emoji.BOLT} Invoke async without payload (no wait)", ("no-payload", "Event")),
+    (f"{Emoji.BOLT} Compose payload and invoke async (no wait)", ("compose", "Event")),
+]
+_INVOKE_BACK_ENTRY = (f"{Emoji.EXIT} Back", ("back", "RequestResponse"))
+
+_INVOKE_MENU_LOCAL = _build_menu(_INVOKE_MENU_ENTRIES + [_INVOKE_BACK_ENTRY])
+_INVOKE_MENU_REMOTE = _build_menu(
+    _INVOKE_MENU_ENTRIES + _INVOKE_ASYNC_MENU_ENTRIES + [_INVOKE_BACK_ENTRY]
+)
+
+
+def _dumps_pretty(data) -> str:
+    """Pretty-print data as JSON (indent=2, non-ASCII kept), using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys, >64-bit ints); fall back to json
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 class InvokeCommand(BaseCommand):
     """Interactive invoke menu for Lambda functions"""
@@ -69,6 +116,10 @@ class InvokeCommand(BaseCommand):
             response_text: Raw response text from Lambda
             func_name: Lambda function name (for saving to centralized outputs directory)
         """
+        # Buffer the formatted output and emit it with a single write
+        buf = io.StringIO()
+        w = buf.write
+
         try:
             # Parse the Lambda response
             response = json.loads(response_text)
@@ -76,33 +127,33 @@ class InvokeCommand(BaseCommand):
             # Prepare structured data for YAML export
             yaml_data = {}
 
-            print(f"\n{Colors.BOLD}{Colors.GREEN}📋 Lambda Response:{Colors.RESET}\n")
+            w(f"\n{Colors.BOLD}{Colors.GREEN}📋 Lambda Response:{Colors.RESET}\n\n")
 
             # Print status code
             if "statusCode" in response:
                 status_code = response["statusCode"]
                 color = Colors.GREEN if 200 <= status_code < 300 else Colors.RED
-                print(f"{Colors.BOLD}Status Code:{Colors.RESET} {color}{status_code}{Colors.RESET}")
+                w(f"{Colors.BOLD}Status Code:{Colors.RESET} {color}{status_code}{Colors.RESET}\n")
                 yaml_data["statusCode"] = status_code
 
             # Print headers if present
             if "headers" in response and response["headers"]:
-                print(f"\n{Colors.BOLD}Headers:{Colors.RESET}")
+                w(f"\n{Colors.BOLD}Headers:{Colors.RESET}\n")
                 for key, value in response["headers"].items():
-                    print(f"  {Colors.CYAN}{key}:{Colors.RESET} {value}")
+                    w(f"  {Colors.CYAN}{key}:{Colors.RESET} {value}\n")
                 yaml_data["headers"] = response["headers"]
 
             # Parse and print body
             if "body" in response:
-                print(f"\n{Colors.BOLD}Body:{Colors.RESET}")
+                w(f"\n{Colors.BOLD}Body:{Colors.RESET}\n")
                 try:
                     # Try to parse body as JSON
                     body_data = json.loads(response["body"])
-                    print(json.dumps(body_data, indent=2, ensure_ascii=False))
+                    w(f"{_dumps_pretty(body_data)}\n")
                     yaml_data["body"] = body_data  # Save parsed body
                 except (json.JSONDecodeError, TypeError):
                     # If not JSON, print as-is
-                    print(response["body"])
+                    w(f"{response['body']}\n")
                     yaml_data["body"] = response["body"]  # Save raw body
 
             # Print other fields if present
@@ -112,10 +163,13 @@ class InvokeCommand(BaseCommand):
                 if k not in ["statusCode", "headers", "body", "multiValueHeaders"]
             }
             if other_fields:
-                print(f"\n{Colors.BOLD}Other Fields:{Colors.RESET}")
-                print(json.dumps(other_fields, indent=2, ensure_ascii=False))
+                w(f"\n{Colors.BOLD}Other Fields:{Colors.RESET}\n")
+                w(f"{_dumps_pretty(other_fields)}\n")
                 yaml_data.update(other_fields)
 
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+
             # Save to YAML file
             self._save_response_to_yaml(yaml_data, func_name)
 
@@ -136,6 +190,8 @@ class InvokeCommand(BaseCommand):
             data: Parsed Lambda response data
             func_name: Lambda function name
         """
+        from core.yaml_compat import YAML_AVAILABLE, safe_dump
+
         if not YAML_AVAILABLE:
             log_warning("PyYAML not installed. Install with: pip install pyyaml")
             return
@@ -150,7 +206,7 @@ class InvokeCommand(BaseCommand):
             output_file = os.path.join(OUTPUTS_DIR, f"{func_name}.yaml")
 
             with open(output_file, "w") as f:
-                yaml.dump(
+                safe_dump(
                     data,
                     f,
                     default_flow_style=False,
@@ -183,7 +239,7 @@ class InvokeCommand(BaseCommand):
         """Execute invoke command"""
         # If function and payload are specified, invoke directly
         if hasattr(args, "function") and args.function:
-            if args.function not in GO_FUNCTIONS:
+            if args.function not in GO_FUNCTIONS_SET:
                 log_error(f"Function '{args.function}' not found in available functions")
                 return False
 
@@ -206,6 +262,37 @@ class InvokeCommand(BaseCommand):
     def get_menu_tree(self) -> MenuNode:
         return super().get_menu_tree()
 
+    @functools.cached_property
+    def payload_composer(self) -> "PayloadComposer":
+        """Composer shared by every invoke (reuses parsed base/metadata files)"""
+        from core.payload_composer import PayloadComposer
+
+        return PayloadComposer(Path(PAYLOADS_DIR))
+
+    def _run_fzf(self, fzf_args: List[str], input_data: bytes) -> Optional[str]:
+        """
+        Run fzf feeding raw bytes through stdin (no text-mode encode/decode)
+
+        Args:
+            fzf_args: fzf arguments (without the "fzf" executable)
+            input_data: Newline-separated options, already encoded
+
+        Returns:
+            Selected line or None if cancelled
+
+        Raises:
+            FileNotFoundError: If fzf is not installed
+        """
+        process = subprocess.Popen(
+            ["fzf", *fzf_args], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        out, _ = process.communicate(input_data)
+
+        if process.returncode != 0:
+            return None
+
+        return out.decode().strip()
+
     def _select_function_with_fzf(self) -> Optional[str]:
         """
         Use fzf to select a function interactively with fuzzy search
@@ -214,13 +301,9 @@ class InvokeCommand(BaseCommand):
             Selected function name or None if cancelled
         """
         try:
-            # Create function list for fzf
-            functions_list = "\n".join(GO_FUNCTIONS)
-
-            # Execute fzf with function list
-            result = subprocess.run(
+            # Execute fzf with the pre-encoded function list
+            selected = self._run_fzf(
                 [
-                    "fzf",
                     "--height",
                     "50%",
                     "--reverse",
@@ -230,15 +313,11 @@ class InvokeCommand(BaseCommand):
                     "--header",
                     f"Total: {len(GO_FUNCTIONS)} functions",
                 ],
-                input=functions_list,
-                text=True,
-                capture_output=True,
+                _GO_FUNCTIONS_INPUT,
             )
 
-            if result.returncode == 0:
-                selected = result.stdout.strip()
-                if selected in GO_FUNCTIONS:
-                    return selected
+            if selected in GO_FUNCTIONS_SET:
+                return selected
 
             return None
 
@@ -251,6 +330,38 @@ class InvokeCommand(BaseCommand):
             log_error(f"Error using fzf: {e}")
             return None
 
+    def _list_json_files(self, directory: str) -> List[str]:
+        """
+        List visible *.json files in a directory (sorted), with a single scandir pass
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Sorted list of JSON file paths
+        """
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith(".")
+            )
+
+    def _write_temp_payload(self, payload_data: Dict) -> str:
+        """
+        Write a processed payload to a unique temporary JSON file
+
+        Args:
+            payload_data: Payload dictionary to write
+
+        Returns:
+            Path to the temporary file
+        """
+        fd, temp_path = tempfile.mkstemp(prefix="manager-invoke-payload-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload_data, f, indent=2, ensure_ascii=False)
+        return temp_path
+
     def _discover_legacy_payloads(self, func_name: str) -> List[tuple]:
         """
         Discover legacy JSON payload files from both shared and function-specific locations
@@ -266,17 +377,13 @@ class InvokeCommand(BaseCommand):
         # 1. Discover SHARED payloads from test-payloads/ (root level)
         shared_dir = "test-payloads"
         if os.path.isdir(shared_dir):
-            pattern = os.path.join(shared_dir, "*.json")
-            shared_payloads = sorted(glob.glob(pattern))
-            for payload_path in shared_payloads:
+            for payload_path in self._list_json_files(shared_dir):
                 payloads.append((payload_path, "SHARED"))
 
         # 2. Discover LOCAL payloads from functions/{function}/payloads/
         local_dir = os.path.join(FUNCTIONS_DIR, func_name, "payloads")
         if os.path.isdir(local_dir):
-            pattern = os.path.join(local_dir, "*.json")
-            local_payloads = sorted(glob.glob(pattern))
-            for payload_path in local_payloads:
+            for payload_path in self._list_json_files(local_dir):
                 payloads.append((payload_path, "LOCAL"))
 
         return payloads
@@ -291,7 +398,7 @@ class InvokeCommand(BaseCommand):
         Returns:
             List of tuples: (payload_path, label)
         """
-        from pathlib import Path
+        from core.payload_navigator import PayloadNavigator
 
         payloads = []
 
@@ -316,7 +423,7 @@ class InvokeCommand(BaseCommand):
         Returns:
             Selected payload file path or None if cancelled
         """
-        from pathlib import Path
+        from core.payload_navigator import PayloadNavigator
 
         try:
             # Use PayloadNavigator for hierarchical navigation
@@ -347,7 +454,7 @@ class InvokeCommand(BaseCommand):
         Returns:
             Full Lambda function name
         """
-        return f"{SERVICE_NAME}-{SERVERLESS_STAGE}-{func_name}"
+        return build_lambda_name(func_name)
 
     def _is_legacy_payload(self, payload_path: str) -> bool:
         """
@@ -359,8 +466,6 @@ class InvokeCommand(BaseCommand):
         Returns:
             True if legacy, False if composable
         """
-        from pathlib import Path
-
         path = Path(payload_path)
 
         # Legacy: JSON en test-payloads/ o functions/*/payloads/
@@ -386,7 +491,7 @@ class InvokeCommand(BaseCommand):
             - processed_path: Path to processed file (temp if modified)
             - composed_payload_or_none: ComposedPayload if composable, None if legacy
         """
-        from pathlib import Path
+        from core.payload_composer import PayloadError
 
         try:
             is_legacy = self._is_legacy_payload(payload_path)
@@ -407,11 +512,7 @@ class InvokeCommand(BaseCommand):
                         )
 
                         # Create temp file with processed payload
-                        timestamp = int(time.time() * 1000)
-                        temp_path = f"/tmp/manager-invoke-payload-{timestamp}.json"
-
-                        with open(temp_path, "w") as f:
-                            json.dump(payload_data, f, indent=2, ensure_ascii=False)
+                        temp_path = self._write_temp_payload(payload_data)
 
                         log_info(f"Body converted from {type(body).__name__} to JSON string")
                         return (temp_path, None)
@@ -421,7 +522,7 @@ class InvokeCommand(BaseCommand):
 
             else:
                 # COMPOSABLE: Usar PayloadComposer
-                composer = PayloadComposer(Path(PAYLOADS_DIR))
+                composer = self.payload_composer
 
                 # Componer payload
                 composed = composer.compose(Path(payload_path), PAYLOAD_DEFAULT_STAGE)
@@ -429,8 +530,9 @@ class InvokeCommand(BaseCommand):
                 # Mostrar fuentes del merge si está habilitado
                 if PAYLOAD_SHOW_MERGE_SOURCES and composed.sources:
                     print(f"\n{Colors.CYAN}📦 Merged from:{Colors.RESET}")
+                    cwd = Path.cwd()
                     for i, source in enumerate(composed.sources, 1):
-                        print(f"  {i}. {source.relative_to(Path.cwd())}")
+                        print(f"  {i}. {source.relative_to(cwd)}")
 
                 # Validar payload final
                 validation = composer.validate(composed.data)
@@ -458,11 +560,7 @@ class InvokeCommand(BaseCommand):
                         )
 
                 # Crear archivo temporal con payload compuesto
-                timestamp = int(time.time() * 1000)
-                temp_path = f"/tmp/manager-invoke-payload-{timestamp}.json"
-
-                with open(temp_path, "w") as f:
-                    json.dump(payload_data, f, indent=2, ensure_ascii=False)
+                temp_path = self._write_temp_payload(payload_data)
 
                 log_success("Payload composed successfully")
                 return (temp_path, composed)
@@ -475,7 +573,7 @@ class InvokeCommand(BaseCommand):
             return (payload_path, None)
 
     def _preview_payload(
-        self, payload_data: Dict, composed: Optional[ComposedPayload] = None
+        self, payload_data: Dict, composed: Optional["ComposedPayload"] = None
     ) -> None:
         """
         Display payload preview with formatting
@@ -484,16 +582,15 @@ class InvokeCommand(BaseCommand):
             payload_data: Payload dictionary to preview
             composed: ComposedPayload if this is a composable payload (optional)
         """
-        from pathlib import Path
-
         print(f"\n{Colors.BOLD}{Colors.CYAN}📄 Payload Preview:{Colors.RESET}")
         print(f"{Colors.YELLOW}{'─' * 60}{Colors.RESET}")
 
         # Si es composable, mostrar fuentes del merge
         if composed and composed.sources:
             print(f"{Colors.CYAN}Merged from:{Colors.RESET}")
+            cwd = Path.cwd()
             for i, source in enumerate(composed.sources, 1):
-                print(f"  {Colors.GREEN}{i}.{Colors.RESET} {source.relative_to(Path.cwd())}")
+                print(f"  {Colors.GREEN}{i}.{Colors.RESET} {source.relative_to(cwd)}")
             print(f"{Colors.YELLOW}{'─' * 60}{Colors.RESET}")
 
         # Mostrar warnings si hay
@@ -508,7 +605,11 @@ class InvokeCommand(BaseCommand):
         print(f"{Colors.YELLOW}{'─' * 60}{Colors.RESET}\n")
 
     def _invoke_function(
-        self, func_name: str, payload_path: Optional[str] = None, local: bool = False
+        self,
+        func_name: str,
+        payload_path: Optional[str] = None,
+        local: bool = False,
+        invocation_type: str = "RequestResponse",
     ) -> bool:
         """
         Execute invoke command (local or remote)
@@ -517,6 +618,7 @@ class InvokeCommand(BaseCommand):
             func_name: Lambda function name
             payload_path: Path to JSON payload file (optional)
             local: True for local invocation, False for remote
+            invocation_type: "RequestResponse" (wait) or "Event" (async, remote only)
 
         Returns:
             True if command executed successfully
@@ -524,7 +626,7 @@ class InvokeCommand(BaseCommand):
         if local:
             return self._invoke_local(func_name, payload_path)
         else:
-            return self._invoke_remote(func_name, payload_path)
+            return self._invoke_remote(func_name, payload_path, invocation_type)
 
     def _invoke_local(self, func_name: str, payload_path: Optional[str] = None) -> bool:
         """
@@ -599,24 +701,38 @@ class InvokeCommand(BaseCommand):
             log_error(f"Error executing command: {e}")
             return False
 
-    def _invoke_remote(self, func_name: str, payload_path: Optional[str] = None) -> bool:
+    def _invoke_remote(
+        self,
+        func_name: str,
+        payload_path: Optional[str] = None,
+        invocation_type: str = "RequestResponse",
+    ) -> bool:
         """
-        Invoke function remotely using configured method (serverless or aws-cli)
+        Invoke function remotely using configured method (serverless, aws-cli or boto3)
+
+        Async ("Event") invocations always go through boto3, since they only
+        need AWS to enqueue the event.
 
         Args:
             func_name: Lambda function name
             payload_path: Path to JSON payload file (optional)
+            invocation_type: "RequestResponse" (wait) or "Event" (async)
 
         Returns:
             True if command executed successfully
         """
+        if invocation_type == "Event":
+            return self._invoke_remote_async(func_name, payload_path)
+
         if INVOKE_REMOTE_METHOD == "serverless":
             return self._invoke_remote_serverless(func_name, payload_path)
         elif INVOKE_REMOTE_METHOD == "aws-cli":
             return self._invoke_remote_aws_cli(func_name, payload_path)
+        elif INVOKE_REMOTE_METHOD == "boto3":
+            return self._invoke_remote_boto3(func_name, payload_path)
         else:
             log_error(f"Unknown INVOKE_REMOTE_METHOD: {INVOKE_REMOTE_METHOD}")
-            log_info("Valid options: 'serverless' or 'aws-cli'")
+            log_info("Valid options: 'serverless', 'aws-cli' or 'boto3'")
             return False
 
     def _invoke_remote_serverless(self, func_name: str, payload_path: Optional[str] = None) -> bool:
@@ -773,6 +889,183 @@ class InvokeCommand(BaseCommand):
             log_error(f"Error executing command: {e}")
             return False
 
+    def _invoke_remote_boto3(self, func_name: str, payload_path: Optional[str] = None) -> bool:
+        """
+        Invoke remote function in-process using the cached boto3 Lambda client
+
+        Args:
+            func_name: Lambda function name
+            payload_path: Path to JSON payload file (optional)
+
+        Returns:
+            True if command executed successfully
+        """
+        lambda_name = self._get_lambda_function_name(func_name)
+        payload_bytes = b""
+
+        if payload_path:
+            if not os.path.isfile(payload_path):
+                log_error(f"Payload file not found: {payload_path}")
+                return False
+
+            # Process payload (convert body if needed, compose if composable)
+            processed_payload_path, composed = self._process_payload(payload_path)
+
+            with open(processed_payload_path, "rb") as f:
+                payload_bytes = f.read()
+            log_info(f"Invoking {lambda_name} remotely (boto3) with payload: {payload_path}")
+        else:
+            log_info(f"Invoking {lambda_name} remotely (boto3) without payload")
+
+        print(f"{Colors.YELLOW}{'─' * 80}{Colors.RESET}\n")
+
+        try:
+            client = self._get_invoke_client()
+            response = client.invoke(
+                FunctionName=lambda_name,
+                InvocationType="RequestResponse",
+                LogType="Tail",  # Include execution logs in response
+                Payload=payload_bytes,
+            )
+
+            # Show execution logs (last 4 KB, base64-encoded by AWS)
+            if response.get("LogResult"):
+                print(f"{Colors.YELLOW}Logs:{Colors.RESET}")
+                print(base64.b64decode(response["LogResult"]).decode("utf-8", "replace"))
+
+            # Parse and format the response
+            response_text = response["Payload"].read().decode("utf-8")
+            if response_text:
+                self._format_lambda_response(response_text.strip(), func_name)
+
+            print(f"\n{Colors.YELLOW}{'─' * 80}{Colors.RESET}")
+
+            if response.get("FunctionError"):
+                log_warning(f"Function returned an error: {response['FunctionError']}")
+            else:
+                log_success("Function invoked successfully")
+            return True
+
+        except ImportError as e:
+            log_error(str(e))
+            return False
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.YELLOW}Command interrupted by user{Colors.RESET}")
+            return True
+        except Exception as e:
+            log_error(f"Error invoking function: {e}")
+            return False
+
+    def _get_invoke_client(self) -> Any:
+        """
+        Get the Lambda client used for remote invokes
+
+        Retries are disabled: a retried invoke runs the function again (after a
+        read timeout or a lost 202 response), which is never what the user asked.
+
+        Returns:
+            boto3 Lambda client
+
+        Raises:
+            ImportError: If boto3 is not installed
+        """
+        from core.aws_clients import get_client
+
+        return get_client(
+            "lambda",
+            INVOKE_AWS_REGION,
+            total_max_attempts=1,
+            read_timeout=_INVOKE_READ_TIMEOUT,
+        )
+
+    def _invoke_remote_async(self, func_name: str, payload_path: Optional[str] = None) -> bool:
+        """
+        Invoke remote function asynchronously (InvocationType=Event) using boto3
+
+        Returns as soon as AWS accepts the event; the function's result is only
+        visible in its logs.
+
+        Args:
+            func_name: Lambda function name
+            payload_path: Path to JSON payload file (optional)
+
+        Returns:
+            True if the event was accepted
+        """
+        lambda_name = self._get_lambda_function_name(func_name)
+        payload_bytes = b""
+
+        if payload_path:
+            if not os.path.isfile(payload_path):
+                log_error(f"Payload file not found: {payload_path}")
+                return False
+
+            # Process payload (convert body if needed, compose if composable)
+            processed_payload_path, composed = self._process_payload(payload_path)
+
+            with open(processed_payload_path, "rb") as f:
+                payload_bytes = f.read()
+            log_info(f"Invoking {lambda_name} asynchronously with payload: {payload_path}")
+        else:
+            log_info(f"Invoking {lambda_name} asynchronously without payload")
+
+        try:
+            client = self._get_invoke_client()
+            response = client.invoke(
+                FunctionName=lambda_name, InvocationType="Event", Payload=payload_bytes
+            )
+
+            status_code = response.get("StatusCode")
+            if status_code == 202:
+                log_success(f"Event accepted (StatusCode {status_code}), not waiting for result")
+            else:
+                log_warning(f"Unexpected StatusCode {status_code}")
+            return True
+
+        except ImportError as e:
+            log_error(str(e))
+            return False
+        except Exception as e:
+            log_error(f"Error invoking function asynchronously: {e}")
+            return False
+
+    def _select_invoke_option_with_fzf(
+        self, func_name: str, is_local: bool
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Use fzf to select an invoke option (menus are precomputed at import time)
+
+        Args:
+            func_name: Lambda function name
+            is_local: True for local, False for remote
+
+        Returns:
+            (action, invocation_type) tuple or None if cancelled
+
+        Raises:
+            FileNotFoundError: If fzf is not installed
+        """
+        menu_text, menu_map = _INVOKE_MENU_LOCAL if is_local else _INVOKE_MENU_REMOTE
+
+        selected = self._run_fzf(
+            [
+                "--height",
+                "40%",
+                "--reverse",
+                "--border",
+                "--prompt",
+                "Select option: ",
+                "--header",
+                f"Invoke {func_name} ({'local' if is_local else 'remote'})",
+            ],
+            menu_text,
+        )
+
+        if selected is None:
+            return None
+
+        return menu_map.get(selected)
+
     def invoke_with_payload_options(self, func_name: str, is_local: bool) -> bool:
         """
         Show payload options menu and invoke function.
@@ -784,48 +1077,24 @@ class InvokeCommand(BaseCommand):
         Returns:
             True if completed successfully
         """
-        from pathlib import Path
-
         log_header(f"{'LOCAL' if is_local else 'REMOTE'} INVOKE - {func_name}")
 
-        # Build menu options
-        options = [
-            f"{Emoji.MONITOR_IN} Invoke without payload",
-            f"{Emoji.PENCIL} Compose payload and invoke",
-            f"{Emoji.EXIT} Back",
-        ]
-
         # Show fzf menu
         try:
-            result = subprocess.run(
-                [
-                    "fzf",
-                    "--height",
-                    "40%",
-                    "--reverse",
-                    "--border",
-                    "--prompt",
-                    "Select option: ",
-                    "--header",
-                    f"Invoke {func_name} ({'local' if is_local else 'remote'})",
-                ],
-                input="\n".join(options),
-                text=True,
-                capture_output=True,
-            )
+            selected = self._select_invoke_option_with_fzf(func_name, is_local)
 
-            if result.returncode != 0:
+            if selected is None:
                 log_info("Cancelled")
                 return False
 
-            selected = result.stdout.strip()
+            action, invocation_type = selected
 
             # Option 1: Without payload
-            if "without payload" in selected:
-                return self._invoke_function(func_name, None, is_local)
+            if action == "no-payload":
+                return self._invoke_function(func_name, None, is_local, invocation_type)
 
             # Option 2: With payload
-            elif "Compose payload" in selected:
+            elif action == "compose":
                 # Navigate and select payload
                 payload_path = self._select_payload_with_fzf(func_name)
                 if not payload_path:
@@ -833,7 +1102,9 @@ class InvokeCommand(BaseCommand):
                     return False
 
                 # Invoke with confirmation
-                return self._invoke_with_confirmation(func_name, payload_path, is_local)
+                return self._invoke_with_confirmation(
+                    func_name, payload_path, is_local, invocation_type
+                )
 
             # Option 3: Back
             else:
@@ -846,7 +1117,13 @@ class InvokeCommand(BaseCommand):
             log_error(f"Error: {e}")
             return False
 
-    def _invoke_with_confirmation(self, func_name: str, payload_path: str, is_local: bool) -> bool:
+    def _invoke_with_confirmation(
+        self,
+        func_name: str,
+        payload_path: str,
+        is_local: bool,
+        invocation_type: str = "RequestResponse",
+    ) -> bool:
         """
         Invoke function with payload after showing preview and asking for confirmation.
 
@@ -854,12 +1131,11 @@ class InvokeCommand(BaseCommand):
             func_name: Lambda function name
             payload_path: Path to payload file
             is_local: True for local, False for remote
+            invocation_type: "RequestResponse" (wait) or "Event" (async, remote only)
 
         Returns:
             True if invoked successfully
         """
-        from pathlib import Path
-
         from config import PAYLOAD_DEFAULT_STAGE
         from core.payload_composer import PayloadComposer, PayloadError
 
@@ -888,7 +1164,7 @@ class InvokeCommand(BaseCommand):
                 if is_local:
                     return self._invoke_local(func_name, payload_path)
                 else:
-                    return self._invoke_remote(func_name, payload_path)
+                    return self._invoke_remote(func_name, payload_path, invocation_type)
             else:
                 log_info("Invocation cancelled")
                 return False
@@ -911,52 +1187,30 @@ class InvokeCommand(BaseCommand):
         Returns:
             True if completed successfully
         """
-        from pathlib import Path
-
         from core.payload_builder import PayloadBuilder
 
         log_header(f"{'LOCAL' if is_local else 'REMOTE'} INVOKE - {func_name}")
 
-        # Build menu options
-        options = [
-            f"{Emoji.MONITOR_IN} Invoke without payload",
-            f"{Emoji.PENCIL} Compose payload and invoke",
-            f"{Emoji.EXIT} Back",
-        ]
-
         # Show fzf menu
         try:
-            result = subprocess.run(
-                [
-                    "fzf",
-                    "--height",
-                    "40%",
-                    "--reverse",
-                    "--border",
-                    "--prompt",
-                    "Select option: ",
-                    "--header",
-                    f"Invoke {func_name} ({'local' if is_local else 'remote'})",
-                ],
-                input="\n".join(options),
-                text=True,
-                capture_output=True,
-            )
+            selected = self._select_invoke_option_with_fzf(func_name, is_local)
 
-            if result.returncode != 0:
+            if selected is None:
                 log_info("Cancelled")
                 return False
 
-            selected = result.stdout.strip()
+            action, invocation_type = selected
 
             # Option 1: Without payload
-            if "without payload" in selected:
-                return self._invoke_function(func_name, None, is_local)
+            if action == "no-payload":
+                return self._invoke_function(func_name, None, is_local, invocation_type)
 
             # Option 2: Compose payload
-            elif "Compose payload" in selected:
+            elif action == "compose":
                 # Launch payload builder
-                builder = PayloadBuilder(Path(PAYLOADS_DIR), PAYLOAD_DEFAULT_STAGE)
+                builder = PayloadBuilder(
+                    Path(PAYLOADS_DIR), PAYLOAD_DEFAULT_STAGE, self.payload_composer
+                )
                 payload_path = builder.build_interactive()
 
                 if not payload_path:
@@ -964,7 +1218,9 @@ class InvokeCommand(BaseCommand):
                     return False
 
                 # Invoke with built payload (with confirmation)
-                return self._invoke_with_confirmation(func_name, str(payload_path), is_local)
+                return self._invoke_with_confirmation(
+                    func_name, str(payload_path), is_local, invocation_type
+                )
 
             # Option 3: Back
             else:
@@ -1,11 +1,27 @@
 """Interactive logs menu for Lambda functions"""
 
+import functools
+import io
+import os
+import queue
+import selectors
 import subprocess
+import sys
+import threading
+import time
 from argparse import ArgumentParser, Namespace
-from typing import Optional
-
-from config import AWS_PROFILE, GO_FUNCTIONS, SERVERLESS_STAGE, SERVICE_NAME
-from core.subprocess_helper import run_in_project_root
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from config import (
+    AWS_PROFILE,
+    GO_FUNCTIONS,
+    LOGS_QUERY_METHOD,
+    SERVERLESS_STAGE,
+    SERVICE_NAME,
+)
+from core.function_utils import GO_FUNCTIONS_SET
+from core.subprocess_helper import popen_in_project_root
 
 from clingy.commands.base import BaseCommand
 from clingy.core.colors import Colors
@@ -20,6 +36,88 @@ from clingy.core.logger import (
 from clingy.core.menu import MenuNode
 
 
+@functools.lru_cache(maxsize=None)
+def _log_group_for(func_name: str) -> str:
+    """Build (and memoize) the CloudWatch log group name for a function"""
+    return f"/aws/lambda/{SERVICE_NAME}-{SERVERLESS_STAGE}-{func_name}"
+
+
+def _produce_log_events(
+    logs: Any, log_group: str, start_ms: int, events: queue.Queue, stop: threading.Event
+) -> None:
+    """
+    Poll FilterLogEvents and push new events onto a queue until stop is set
+
+    Runs in a background thread. Each round resumes from the newest timestamp
+    seen (event IDs at that timestamp are skipped to avoid duplicates). On
+    error the exception is queued and the thread exits.
+
+    Args:
+        logs: boto3 CloudWatch Logs client
+        log_group: CloudWatch log group name
+        start_ms: Initial start time (epoch milliseconds)
+        events: Bounded queue consumed by the display thread
+        stop: Event set by the consumer to end polling
+    """
+    seen_at_start = set()
+
+    try:
+        while not stop.is_set():
+            params = {"logGroupName": log_group, "startTime": start_ms}
+
+            while not stop.is_set():
+                response = logs.filter_log_events(**params)
+
+                for event in response.get("events", []):
+                    if event["eventId"] in seen_at_start:
+                        continue
+                    if event["timestamp"] > start_ms:
+                        start_ms = event["timestamp"]
+                        seen_at_start = set()
+                    seen_at_start.add(event["eventId"])
+
+                    # Block while the display catches up, but keep honoring stop
+                    while not stop.is_set():
+                        try:
+                            events.put(event, timeout=0.25)
+                            break
+                        except queue.Full:
+                            continue
+
+                if not response.get("nextToken"):
+                    break
+                params["nextToken"] = response["nextToken"]
+
+            stop.wait(_FOLLOW_POLL_INTERVAL)
+
+    except Exception as e:
+        events.put(e)
+
+
+# Buffer size for writing saved logs (multi-MB outputs go out in one write)
+_LOG_WRITE_BUFFER_SIZE = 1 << 20
+
+# Follow mode (boto3): max buffered events and delay between polls (seconds)
+_FOLLOW_QUEUE_SIZE = 10_000
+_FOLLOW_POLL_INTERVAL = 1.0
+
+# Logs Insights search limits (custom query option)
+_INSIGHTS_LIMIT = 10000
+_INSIGHTS_MAX_WAIT = 60
+
+# Log options menu (static): display text -> option number
+_LOG_MENU = [
+    (f"{Emoji.DOCUMENT} Last 30 minutes", "1"),
+    (f"{Emoji.LIST} Last 5 minutes", "2"),
+    (f"{Emoji.CIRCULAR}  Real time", "3"),
+    (f"{Emoji.SEARCH} Filter logs with custom query", "4"),
+    (f"{Emoji.EXIT} Back to function selection", "0"),
+]
+_LOG_MENU_TEXT = "\n".join(label for label, _ in _LOG_MENU)
+# fzf output is stripped, so key on stripped labels (an empty emoji leaves leading spaces)
+_LOG_MENU_MAP = {label.strip(): option for label, option in _LOG_MENU}
+
+
 class LogsCommand(BaseCommand):
     """Interactive logs menu for Lambda functions"""
 
@@ -43,7 +141,7 @@ class LogsCommand(BaseCommand):
         """Execute logs command"""
         # If function is pre-selected (from dev menu), go directly to logs submenu
         if hasattr(args, "function") and args.function:
-            if args.function in GO_FUNCTIONS:
+            if args.function in GO_FUNCTIONS_SET:
                 return self._show_logs_submenu(args.function) or True
             else:
                 log_error(f"Function '{args.function}' not found in available functions")
@@ -65,7 +163,7 @@ class LogsCommand(BaseCommand):
         Returns:
             Full log group name
         """
-        return f"/aws/lambda/{SERVICE_NAME}-{SERVERLESS_STAGE}-{func_name}"
+        return _log_group_for(func_name)
 
     def _save_logs_to_file(self, func_name: str, logs_output: str) -> None:
         """
@@ -75,8 +173,6 @@ class LogsCommand(BaseCommand):
             func_name: Lambda function name
             logs_output: Log output to save
         """
-        import os
-
         from config import LOGS_DIR
 
         # Create logs folder if it doesn't exist
@@ -84,8 +180,10 @@ class LogsCommand(BaseCommand):
 
         # Write logs to centralized logs directory
         log_file_path = os.path.join(LOGS_DIR, f"{func_name}.log")
-        with open(log_file_path, "w", encoding="utf-8") as f:
-            f.write(logs_output)
+        # Encode once and write bytes in a single call (no text-codec buffering)
+        data = logs_output.encode("utf-8", "replace")
+        with open(log_file_path, "wb", buffering=_LOG_WRITE_BUFFER_SIZE) as f:
+            f.write(data)
 
         # Get absolute path for display
         abs_path = os.path.abspath(log_file_path)
@@ -105,6 +203,14 @@ class LogsCommand(BaseCommand):
         """
         log_group = self._get_log_group_name(func_name)
 
+        # Use the cached boto3 logs client when available (AWS CLI otherwise)
+        from core.aws_clients import BOTO3_AVAILABLE
+
+        if BOTO3_AVAILABLE:
+            if option == "3":
+                return self._follow_logs_boto3(func_name, log_group)
+            return self._fetch_logs_boto3(func_name, log_group, option, query)
+
         # Build base command
         command = ["aws", "logs", "tail", log_group, "--profile", AWS_PROFILE]
 
@@ -138,43 +244,55 @@ class LogsCommand(BaseCommand):
 
         try:
             if capture_output:
-                # Capture output for saving to file
-                result = run_in_project_root(command, check=False, capture_output=True, text=True)
-
-                # Display output
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr:
-                    print(result.stderr)
+                # Stream output as it arrives, keeping a copy for saving to file
+                buf = io.StringIO()
+                with popen_in_project_root(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                ) as proc:
+                    for line in proc.stdout:
+                        sys.stdout.write(line)
+                        buf.write(line)
 
                 print(f"\n{Colors.YELLOW}{'─' * 80}{Colors.RESET}")
 
                 # Save to file
-                combined_output = result.stdout if result.stdout else ""
-                if result.stderr:
-                    combined_output += "\n" + result.stderr
-
+                combined_output = buf.getvalue()
                 if combined_output.strip():
                     self._save_logs_to_file(func_name, combined_output)
 
-                if result.returncode == 0:
+                if proc.returncode == 0:
                     log_success("Command executed successfully")
                     return True
                 else:
-                    log_warning(f"Command finished with code {result.returncode}")
+                    log_warning(f"Command finished with code {proc.returncode}")
                     return True  # Return True anyway to continue menu
             else:
-                # Stream output in real-time for --follow mode
-                result = run_in_project_root(command, check=False)
+                # Stream output in real-time for --follow mode (until Ctrl+C).
+                # The aws CLI block-buffers stdout into a pipe, so force it unbuffered
+                with popen_in_project_root(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                ) as proc:
+                    followed_output, interrupted = self._tail(proc)
 
                 print(f"\n{Colors.YELLOW}{'─' * 80}{Colors.RESET}")
-                print(f"{Colors.YELLOW}Note: --follow mode output not saved to file{Colors.RESET}")
 
-                if result.returncode == 0:
+                if followed_output.strip():
+                    self._save_logs_to_file(func_name, followed_output)
+
+                if proc.returncode == 0 or interrupted:
+                    # Ctrl+C also reaches the CLI, which may exit with 130 or -SIGTERM
                     log_success("Command executed successfully")
                     return True
                 else:
-                    log_warning(f"Command finished with code {result.returncode}")
+                    log_warning(f"Command finished with code {proc.returncode}")
                     return True  # Return True anyway to continue menu
 
         except subprocess.CalledProcessError as e:
@@ -188,38 +306,305 @@ class LogsCommand(BaseCommand):
             print(f"\n\n{Colors.YELLOW}Command interrupted by user{Colors.RESET}")
             return True
 
-    def _select_log_option_with_fzf(self, func_name: str) -> Optional[str]:
+    def _tail(self, proc: subprocess.Popen) -> Tuple[str, bool]:
         """
-        Use fzf to select a log viewing option
+        Echo a follow-mode process's output until it exits or Ctrl+C is pressed
+
+        Blocks in select() instead of polling, so an idle tail uses no CPU, and
+        forwards raw bytes as soon as they arrive.
+
+        Args:
+            proc: Running process with stdout=PIPE (binary mode)
+
+        Returns:
+            Everything the process printed (decoded as UTF-8), and whether
+            following was stopped with Ctrl+C
+        """
+        fd = proc.stdout.fileno()
+        out = sys.stdout.buffer
+        chunks = []
+        interrupted = False
+
+        sel = selectors.DefaultSelector()
+        sel.register(fd, selectors.EVENT_READ)
+        try:
+            while True:
+                if not sel.select(timeout=1.0):
+                    if proc.poll() is not None:
+                        break
+                    continue
+
+                data = os.read(fd, 65536)
+                if not data:  # EOF
+                    break
+
+                out.write(data)
+                out.flush()
+                chunks.append(data)
+
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.YELLOW}Stopped following logs{Colors.RESET}")
+            interrupted = True
+            proc.terminate()
+        finally:
+            sel.close()
+
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+        return b"".join(chunks).decode("utf-8", "replace"), interrupted
+
+    def _fetch_logs_boto3(
+        self, func_name: str, log_group: str, option: str, query: str = None
+    ) -> bool:
+        """
+        Fetch logs in-process with boto3 (no AWS CLI startup per request)
 
         Args:
             func_name: Lambda function name
+            log_group: CloudWatch log group name
+            option: Log option selected (1, 2 or 4)
+            query: CloudWatch filter pattern (only for option 4). With
+                LOGS_QUERY_METHOD = "insights" it is a substring search instead,
+                see _run_insights
 
         Returns:
-            Option number (1-4) or None if cancelled/back
+            True if logs were fetched
         """
-        # Build menu options
-        options = []
-        option_map = {}  # Map display text to option number
+        from core.aws_clients import get_client
 
-        options.append(f"{Emoji.DOCUMENT} Last 30 minutes")
-        option_map[options[-1]] = "1"
+        if option == "1":
+            minutes = 30
+            log_info(f"Getting logs from the last 30 minutes for {func_name}")
+        elif option == "2":
+            minutes = 5
+            log_info(f"Getting logs with short format for {func_name}")
+        elif not query:
+            log_error("A query is required for this option")
+            return False
+        elif LOGS_QUERY_METHOD == "insights":
+            # Custom query: run server-side with Logs Insights
+            return self._run_insights(func_name, log_group, query)
+        else:
+            # Custom query: same filter pattern semantics as 'aws logs tail --filter-pattern'
+            minutes = 30
+            log_info(f"Filtering logs with pattern '{query}' for {func_name}")
+
+        params = {
+            "logGroupName": log_group,
+            "startTime": int((time.time() - minutes * 60) * 1000),
+        }
+        if option == "4":
+            params["filterPattern"] = query
+
+        print(f"\n{Colors.CYAN}Fetching: {log_group} (last {minutes}m){Colors.RESET}\n")
+        print(f"{Colors.YELLOW}{'─' * 80}{Colors.RESET}\n")
 
-        options.append(f"{Emoji.LIST} Last 5 minutes")
-        option_map[options[-1]] = "2"
+        # Print each page as it arrives; keep the lines only for the saved log file
+        lines = []
+        try:
+            paginator = get_client("logs").get_paginator("filter_log_events")
+            for page in paginator.paginate(**params):
+                page_lines = []
+                for event in page.get("events", []):
+                    timestamp = datetime.fromtimestamp(event["timestamp"] / 1000)
+                    page_lines.append(
+                        f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')} {event['message'].rstrip()}"
+                    )
+                if page_lines:
+                    print("\n".join(page_lines), flush=True)
+                    lines.extend(page_lines)
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.YELLOW}Command interrupted by user{Colors.RESET}")
+            if lines:
+                self._save_logs_to_file(func_name, "\n".join(lines))
+            return True
+        except Exception as e:
+            if lines:
+                self._save_logs_to_file(func_name, "\n".join(lines))
+            log_error(f"Error fetching logs: {e}")
+            return False
 
-        options.append(f"{Emoji.CIRCULAR}  Real time")
-        option_map[options[-1]] = "3"
+        print(f"\n{Colors.YELLOW}{'─' * 80}{Colors.RESET}")
 
-        options.append(f"{Emoji.SEARCH} Filter logs with custom query")
-        option_map[options[-1]] = "4"
+        if lines:
+            self._save_logs_to_file(func_name, "\n".join(lines))
 
-        options.append(f"{Emoji.EXIT} Back to function selection")
-        option_map[options[-1]] = "0"
+        log_success(f"Fetched {len(lines)} log events")
+        return True
+
+    def _follow_logs_boto3(self, func_name: str, log_group: str, minutes: int = 5) -> bool:
+        """
+        Follow logs in real time with boto3 until Ctrl+C
 
-        # Create fzf input
-        options_text = "\n".join(options)
+        A background thread polls FilterLogEvents into a bounded queue while
+        this thread drains and prints it, so network round-trips never stall
+        the display.
+
+        Args:
+            func_name: Lambda function name
+            log_group: CloudWatch log group name
+            minutes: How far back to start
+
+        Returns:
+            True when following stops
+        """
+        from core.aws_clients import get_client
+
+        log_info(f"Following logs in real-time for {func_name} (Ctrl+C to stop)")
+        print(f"\n{Colors.CYAN}Following: {log_group} (since {minutes}m){Colors.RESET}\n")
+        print(f"{Colors.YELLOW}{'─' * 80}{Colors.RESET}\n")
+
+        events = queue.Queue(maxsize=_FOLLOW_QUEUE_SIZE)
+        stop = threading.Event()
+        start_ms = int((time.time() - minutes * 60) * 1000)
 
+        try:
+            producer = threading.Thread(
+                target=_produce_log_events,
+                args=(get_client("logs"), log_group, start_ms, events, stop),
+                daemon=True,
+            )
+        except Exception as e:
+            log_error(f"Error creating logs client: {e}")
+            return False
+
+        producer.start()
+        lines = []
+
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=0.25)
+                except queue.Empty:
+                    continue
+
+                if isinstance(event, Exception):
+                    log_error(f"Error fetching logs: {event}")
+                    break
+
+                timestamp = datetime.fromtimestamp(event["timestamp"] / 1000)
+                line = f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')} {event['message'].rstrip()}"
+                print(line, flush=True)
+                lines.append(line)
+
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.YELLOW}Stopped following logs{Colors.RESET}")
+        finally:
+            stop.set()
+
+        print(f"\n{Colors.YELLOW}{'─' * 80}{Colors.RESET}")
+
+        if lines:
+            self._save_logs_to_file(func_name, "\n".join(lines))
+
+        log_success(f"Received {len(lines)} log events")
+        return True
+
+    def _run_insights(self, func_name: str, log_group: str, query: str, minutes: int = 30) -> bool:
+        """
+        Search logs with a CloudWatch Logs Insights query
+
+        Insights scans the log group server-side in parallel, which is much
+        faster than paginating FilterLogEvents on busy log groups.
+
+        Args:
+            func_name: Lambda function name
+            log_group: CloudWatch log group name
+            query: Text to search for in @message (substring match)
+            minutes: How far back to search
+
+        Returns:
+            True if the query completed
+        """
+        from core.aws_clients import get_client
+
+        log_info(f"Searching logs for '{query}' with Logs Insights for {func_name}")
+
+        escaped = query.replace("\\", "\\\\").replace('"', '\\"')
+        query_string = (
+            f'fields @timestamp, @message | filter @message like "{escaped}" '
+            f"| sort @timestamp desc | limit {_INSIGHTS_LIMIT}"
+        )
+        end_time = int(time.time())
+
+        print(f"\n{Colors.CYAN}Insights query: {query_string}{Colors.RESET}\n")
+        print(f"{Colors.YELLOW}{'─' * 80}{Colors.RESET}\n")
+
+        try:
+            logs = get_client("logs")
+            query_id = logs.start_query(
+                logGroupName=log_group,
+                startTime=end_time - minutes * 60,
+                endTime=end_time,
+                queryString=query_string,
+            )["queryId"]
+
+            deadline = time.time() + _INSIGHTS_MAX_WAIT
+            response = logs.get_query_results(queryId=query_id)
+            while response["status"] in ("Scheduled", "Running"):
+                if time.time() > deadline:
+                    logs.stop_query(queryId=query_id)
+                    log_error(f"Query timed out after {_INSIGHTS_MAX_WAIT}s")
+                    return False
+                time.sleep(0.5)
+                response = logs.get_query_results(queryId=query_id)
+
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.YELLOW}Command interrupted by user{Colors.RESET}")
+            return True
+        except Exception as e:
+            log_error(f"Error running Insights query: {e}")
+            return False
+
+        if response["status"] != "Complete":
+            log_error(f"Query {response['status']}")
+            return False
+
+        # Newest first from the query; print oldest first like 'aws logs tail'
+        lines = [
+            "\t".join(field["value"] for field in row if field["field"] != "@ptr")
+            for row in reversed(response.get("results", []))
+        ]
+
+        logs_output = "\n".join(lines)
+        if logs_output:
+            print(logs_output)
+
+        print(f"\n{Colors.YELLOW}{'─' * 80}{Colors.RESET}")
+
+        if logs_output:
+            self._save_logs_to_file(func_name, logs_output)
+
+        log_success(f"Found {len(lines)} matching log events")
+        return True
+
+    def _query_prompt(self) -> str:
+        """
+        Prompt for the custom query option, matching how the query will be applied
+
+        Returns:
+            Prompt text for input()
+        """
+        from core.aws_clients import BOTO3_AVAILABLE
+
+        if LOGS_QUERY_METHOD == "insights" and BOTO3_AVAILABLE:
+            return "Enter text to search for (Logs Insights, e.g., ERROR, timeout): "
+        return 'Enter filter pattern (e.g., ERROR, "?ERROR ?WARN"): '
+
+    def _select_log_option_with_fzf(self, func_name: str) -> Optional[str]:
+        """
+        Use fzf to select a log viewing option
+
+        Args:
+            func_name: Lambda function name
+
+        Returns:
+            Option number (1-4) or None if cancelled/back
+        """
         try:
             result = subprocess.run(
                 [
@@ -233,14 +618,13 @@ class LogsCommand(BaseCommand):
                     "--header",
                     f"Log options for: {func_name}",
                 ],
-                input=options_text,
+                input=_LOG_MENU_TEXT,
                 text=True,
                 capture_output=True,
             )
 
             if result.returncode == 0:
-                selected = result.stdout.strip()
-                return option_map.get(selected)
+                return _LOG_MENU_MAP.get(result.stdout.strip())
 
             return None
 
@@ -276,9 +660,7 @@ class LogsCommand(BaseCommand):
                 input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.RESET}")
             elif option == "4":
                 # Custom query - prompt for input
-                query = input(
-                    f"\n{Colors.BOLD}Enter filter/query (e.g., ERROR, WARN, etc.): {Colors.RESET}"
-                ).strip()
+                query = input(f"\n{Colors.BOLD}{self._query_prompt()}{Colors.RESET}").strip()
                 if query:
                     self._execute_logs_command(func_name, option, query)
                     input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.RESET}")
@@ -318,7 +700,7 @@ class LogsCommand(BaseCommand):
 
             if result.returncode == 0:
                 selected = result.stdout.strip()
-                if selected in GO_FUNCTIONS:
+                if selected in GO_FUNCTIONS_SET:
                     return selected
 
             return None
@@ -1,10 +1,13 @@
 """Compress binaries to zip files"""
 
 import os
-import subprocess
+import shutil
+import stat
 import time
+import zipfile
 from argparse import ArgumentParser, Namespace
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional
 
 from config import BIN_DIR, GO_FUNCTIONS
 from core.function_utils import resolve_function_list
@@ -22,6 +25,30 @@ from clingy.core.logger import (
 from clingy.core.menu import MenuNode
 from clingy.core.stats import stats
 
+# Fixed timestamp for zip entries (earliest date the zip format supports)
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+# Read size when streaming the bootstrap into the archive
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _remove_if_exists(path: str) -> None:
+    """Delete a file, ignoring it if it is already gone"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class _ZipResult(NamedTuple):
+    """Outcome of compressing a single function"""
+
+    func_name: str
+    success: bool
+    duration: float
+    message: str
+    detail: str = ""
+
 
 class ZipCommand(BaseCommand):
     """Compress binaries to zip files"""
@@ -33,6 +60,7 @@ class ZipCommand(BaseCommand):
   manager.py zip                   # Compress all built functions
   manager.py zip -f status         # Compress only the status function
   manager.py zip -f getVendedores  # Compress only getVendedores function
+  manager.py zip --force           # Re-compress even if the zip is up to date
 """
 
     def add_arguments(self, parser: ArgumentParser):
@@ -43,6 +71,11 @@ class ZipCommand(BaseCommand):
             type=str,
             help="Specific function name to compress (e.g., status, getClientes)",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-compress functions whose zip is already newer than the bootstrap",
+        )
 
     def execute(self, args: Namespace) -> bool:
         """Execute zip command"""
@@ -59,7 +92,7 @@ class ZipCommand(BaseCommand):
             stats.total_functions = len(functions_to_zip)
 
         # Compress functions
-        success = self._zip_functions(functions_to_zip)
+        success = self._zip_functions(functions_to_zip, force=getattr(args, "force", False))
 
         # Print summary
         print_summary()
@@ -69,12 +102,117 @@ class ZipCommand(BaseCommand):
     def get_menu_tree(self) -> MenuNode:
         return super().get_menu_tree()
 
-    def _zip_functions(self, functions_to_zip: List[str]) -> bool:
+    def _write_zip(self, zip_file: str, bootstrap_file: str) -> None:
+        """
+        Write bootstrap into zip_file as a single deflated "bootstrap" entry
+
+        The entry gets a fixed timestamp (reproducible archives) and 0755
+        permissions so it stays executable in the Lambda runtime.
+
+        Args:
+            zip_file: Destination zip path
+            bootstrap_file: Compiled bootstrap binary to compress
+        """
+        zinfo = zipfile.ZipInfo("bootstrap", date_time=_ZIP_EPOCH)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = (stat.S_IFREG | 0o755) << 16
+
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            with open(bootstrap_file, "rb") as src, zf.open(zinfo, "w") as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+    def _zip_is_stale(self, zip_file: str, bootstrap_mtime: float) -> bool:
+        """
+        Check whether zip_file needs to be rebuilt from the bootstrap
+
+        Args:
+            zip_file: Existing (or missing) zip path
+            bootstrap_mtime: Modification time of the compiled bootstrap
+
+        Returns:
+            True if the zip is missing or older than the bootstrap
+        """
+        try:
+            return os.stat(zip_file).st_mtime < bootstrap_mtime
+        except FileNotFoundError:
+            return True
+
+    def zip_one(self, func_name: str, force: bool = False) -> _ZipResult:
+        """
+        Compress a single function's bootstrap (runs in a worker thread, no logging)
+
+        Args:
+            func_name: Function name to compress
+            force: Re-compress even if the zip is newer than the bootstrap
+
+        Returns:
+            _ZipResult describing the outcome
         """
-        Compress Go functions with enhanced logging and filtering
+        start_time = time.time()
+
+        output_dir = os.path.abspath(os.path.join(BIN_DIR, func_name))
+        zip_file = os.path.join(output_dir, f"{func_name}.zip")
+        bootstrap_file = os.path.join(output_dir, "bootstrap")
+
+        # Validate bootstrap file exists (one stat also gives its size and mtime)
+        try:
+            bootstrap_stat = os.stat(bootstrap_file)
+        except FileNotFoundError:
+            return _ZipResult(
+                func_name,
+                False,
+                time.time() - start_time,
+                f"{func_name} → bootstrap not found: {bootstrap_file}",
+            )
+        bootstrap_size = bootstrap_stat.st_size
+
+        # Skip functions whose zip was produced from the current bootstrap
+        if not force and not self._zip_is_stale(zip_file, bootstrap_stat.st_mtime):
+            return _ZipResult(
+                func_name, True, time.time() - start_time, f"{func_name} → up-to-date (skipped)"
+            )
+
+        # Compress in-process (no external 'zip' fork/exec) into a temp file and
+        # swap it in, so a failed write never leaves a truncated zip that looks
+        # newer than the bootstrap
+        tmp_file = f"{zip_file}.{os.getpid()}.tmp"
+        try:
+            self._write_zip(tmp_file, bootstrap_file)
+            os.replace(tmp_file, zip_file)
+        except OSError as e:
+            _remove_if_exists(tmp_file)
+            return _ZipResult(
+                func_name,
+                False,
+                time.time() - start_time,
+                f"{func_name} → compression failed",
+                str(e),
+            )
+        except BaseException:
+            _remove_if_exists(tmp_file)
+            raise
+
+        duration = time.time() - start_time
+
+        zip_size = os.stat(zip_file).st_size
+        compression_ratio = (1 - zip_size / bootstrap_size) * 100 if bootstrap_size > 0 else 0
+        return _ZipResult(
+            func_name,
+            True,
+            duration,
+            f"{func_name} → {zip_size:,} bytes (-{compression_ratio:.1f}%)",
+        )
+
+    def _zip_functions(self, functions_to_zip: List[str], force: bool = False) -> bool:
+        """
+        Compress Go functions in parallel with enhanced logging and filtering
+
+        Each function is zipped in a worker thread; results are logged from the
+        main thread as they complete so output lines never interleave.
 
         Args:
             functions_to_zip: List of function names to compress
+            force: Re-compress functions whose zip is already up to date
 
         Returns:
             True if all compressions succeeded, False otherwise
@@ -82,69 +220,29 @@ class ZipCommand(BaseCommand):
         log_section(f"COMPRESSING {len(functions_to_zip)} FUNCTIONS")
 
         overall_success = True
+        total = len(functions_to_zip)
+        # Only count success if this is a standalone zip command (not after build)
+        count_success = stats.total_functions == total
+        max_workers = min(32, (os.cpu_count() or 4) * 2, total)
 
-        for i, func_name in enumerate(functions_to_zip, 1):
-            log_info(f"Compressing function {i}/{len(functions_to_zip)}: {func_name}")
-            start_time = time.time()
-
-            output_dir = os.path.abspath(os.path.join(BIN_DIR, func_name))
-            zip_file = os.path.join(output_dir, f"{func_name}.zip")
-            bootstrap_file = os.path.join(output_dir, "bootstrap")
-
-            # Validate bootstrap file exists
-            if not os.path.exists(bootstrap_file):
-                duration = time.time() - start_time
-                log_error(f"{func_name} → bootstrap not found: {bootstrap_file}", duration)
-                stats.add_failure(func_name)
-                overall_success = False
-                continue
-
-            # Remove old zip file if it exists
-            if os.path.exists(zip_file):
-                os.remove(zip_file)
-
-            # Compression command
-            zip_command = ["zip", "-j", zip_file, bootstrap_file]
-
-            try:
-                result = subprocess.run(zip_command, check=True, capture_output=True, text=True)
-
-                duration = time.time() - start_time
-
-                if result.returncode == 0 and os.path.exists(zip_file):
-                    zip_size = os.path.getsize(zip_file)
-                    bootstrap_size = os.path.getsize(bootstrap_file)
-                    compression_ratio = (
-                        (1 - zip_size / bootstrap_size) * 100 if bootstrap_size > 0 else 0
-                    )
-
-                    log_success(
-                        f"{func_name} → {zip_size:,} bytes (-{compression_ratio:.1f}%)",
-                        duration,
-                    )
-                    # Only count success if this is a standalone zip command (not after build)
-                    if stats.total_functions == len(functions_to_zip):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.zip_one, f, force): f for f in functions_to_zip}
+
+            for i, future in enumerate(as_completed(futures), 1):
+                func_name = futures[future]
+                result = future.result()
+
+                log_info(f"Finished function {i}/{total}: {func_name}")
+
+                if result.success:
+                    log_success(result.message, result.duration)
+                    if count_success:
                         stats.add_success()
                 else:
-                    log_error(f"{func_name} → compression failed", duration)
-                    if result.stderr:
-                        print(f"  {Colors.RED}Error: {result.stderr.strip()}{Colors.RESET}")
+                    log_error(result.message, result.duration)
+                    if result.detail:
+                        print(f"  {Colors.RED}Error: {result.detail}{Colors.RESET}")
                     stats.add_failure(func_name)
                     overall_success = False
 
-            except subprocess.CalledProcessError as e:
-                duration = time.time() - start_time
-                log_error(f"{func_name} → error executing zip", duration)
-                if e.stderr:
-                    print(f"  {Colors.RED}Error: {e.stderr.strip()}{Colors.RESET}")
-                stats.add_failure(func_name)
-                overall_success = False
-
-            except FileNotFoundError:
-                duration = time.time() - start_time
-                log_error("'zip' command not found on system", duration)
-                stats.add_failure(func_name)
-                overall_success = False
-                break  # If zip is not available, don't try more functions
-
         return overall_success
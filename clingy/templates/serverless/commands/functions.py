@@ -1,18 +1,66 @@
 """Functions menu - Build, Zip, Deploy, Clean Lambda functions"""
 
+import contextlib
+import functools
+import os
+import queue
+import threading
 from argparse import ArgumentParser, Namespace
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
-from commands.core_commands.build import BuildCommand
-from commands.core_commands.clean import CleanCommand
-from commands.core_commands.deploy import DeployCommand
-from commands.core_commands.zip import ZipCommand
-from config import GO_FUNCTIONS
+from core.function_utils import ALL_FUNCTIONS, FunctionArgs, select_functions
 
 from clingy.commands.base import BaseCommand
+from clingy.core.colors import Colors
 from clingy.core.emojis import Emoji
-from clingy.core.logger import log_error, log_info, log_section, log_success
-from clingy.core.menu import MenuNode, fzf_select_items
+from clingy.core.logger import (
+    log_error,
+    log_info,
+    log_section,
+    log_success,
+    log_warning,
+    print_summary,
+)
+from clingy.core.menu import MenuNode
+from clingy.core.stats import stats
+
+if TYPE_CHECKING:
+    from commands.core_commands.build import BuildCommand
+    from commands.core_commands.clean import CleanCommand
+    from commands.core_commands.deploy import DeployCommand
+    from commands.core_commands.zip import ZipCommand
+
+# Stage labels used when logging pipeline results (index = stage number)
+_PIPELINE_STAGES = ("Build", "Zip", "Deploy")
+
+
+def _all_or_selected(
+    label: str,
+    emoji: str,
+    all_choice: Tuple[str, Callable[[], bool]],
+    selected_choice: Tuple[str, Callable[[], bool]],
+) -> MenuNode:
+    """
+    Build a submenu with an "all functions" and a "select functions" action
+
+    Args:
+        label: Submenu label
+        emoji: Submenu emoji
+        all_choice: (label, action) for the all-functions entry
+        selected_choice: (label, action) for the select-functions entry
+
+    Returns:
+        Submenu MenuNode
+    """
+    return MenuNode(
+        label=label,
+        emoji=emoji,
+        children=[
+            MenuNode(label=all_choice[0], action=all_choice[1]),
+            MenuNode(label=selected_choice[0], action=selected_choice[1]),
+        ],
+    )
 
 
 class FunctionsCommand(BaseCommand):
@@ -32,83 +80,80 @@ class FunctionsCommand(BaseCommand):
 
     def get_menu_tree(self) -> Optional[MenuNode]:
         """Interactive menu for functions management"""
+        return self.menu_tree
+
+    @functools.cached_property
+    def menu_tree(self) -> MenuNode:
+        """Menu tree, built once per instance (actions are bound to self)"""
         return MenuNode(
             label="Functions",
             emoji=Emoji.LAMBDA,
             children=[
-                MenuNode(
-                    label="Build Functions",
-                    emoji=Emoji.BUILD,
-                    children=[
-                        MenuNode(
-                            label="Build All",
-                            action=lambda: self._build_all(),
-                        ),
-                        MenuNode(
-                            label="Select Functions to Build",
-                            action=lambda: self._build_selected(),
-                        ),
-                    ],
+                _all_or_selected(
+                    "Build Functions",
+                    Emoji.BUILD,
+                    ("Build All", self._build_all),
+                    ("Select Functions to Build", self._build_selected),
                 ),
-                MenuNode(
-                    label="Zip Functions",
-                    emoji=Emoji.ZIP,
-                    children=[
-                        MenuNode(
-                            label="Zip All",
-                            action=lambda: self._zip_all(),
-                        ),
-                        MenuNode(
-                            label="Select Functions to Zip",
-                            action=lambda: self._zip_selected(),
-                        ),
-                    ],
+                _all_or_selected(
+                    "Zip Functions",
+                    Emoji.ZIP,
+                    ("Zip All", self._zip_all),
+                    ("Select Functions to Zip", self._zip_selected),
                 ),
-                MenuNode(
-                    label="Deploy Functions",
-                    emoji=Emoji.DEPLOY,
-                    children=[
-                        MenuNode(
-                            label="Deploy All",
-                            action=lambda: self._deploy_all(),
-                        ),
-                        MenuNode(
-                            label="Select Functions to Deploy",
-                            action=lambda: self._deploy_selected(),
-                        ),
-                    ],
+                _all_or_selected(
+                    "Deploy Functions",
+                    Emoji.DEPLOY,
+                    ("Deploy All", self._deploy_all),
+                    ("Select Functions to Deploy", self._deploy_selected),
                 ),
-                MenuNode(
-                    label="Full Pipeline (Build → Zip → Deploy)",
-                    emoji=Emoji.ALL,
-                    children=[
-                        MenuNode(
-                            label="Full Pipeline - All Functions",
-                            action=lambda: self._full_pipeline_all(),
-                        ),
-                        MenuNode(
-                            label="Full Pipeline - Select Functions",
-                            action=lambda: self._full_pipeline_selected(),
-                        ),
-                    ],
+                _all_or_selected(
+                    "Full Pipeline (Build → Zip → Deploy)",
+                    Emoji.ALL,
+                    ("Full Pipeline - All Functions", self._full_pipeline_all),
+                    ("Full Pipeline - Select Functions", self._full_pipeline_selected),
                 ),
-                MenuNode(
-                    label="Clean Build Artifacts",
-                    emoji=Emoji.TRASH,
-                    children=[
-                        MenuNode(
-                            label="Clean All",
-                            action=lambda: self._clean_all(),
-                        ),
-                        MenuNode(
-                            label="Select Functions to Clean",
-                            action=lambda: self._clean_selected(),
-                        ),
-                    ],
+                _all_or_selected(
+                    "Clean Build Artifacts",
+                    Emoji.TRASH,
+                    ("Clean All", self._clean_all),
+                    ("Select Functions to Clean", self._clean_selected),
                 ),
             ],
         )
 
+    # ========================================================================
+    # Commands (created on first use, then reused)
+    # ========================================================================
+
+    @functools.cached_property
+    def build_cmd(self) -> "BuildCommand":
+        """Shared BuildCommand instance"""
+        from commands.core_commands.build import BuildCommand
+
+        return BuildCommand()
+
+    @functools.cached_property
+    def zip_cmd(self) -> "ZipCommand":
+        """Shared ZipCommand instance"""
+        from commands.core_commands.zip import ZipCommand
+
+        return ZipCommand()
+
+    @functools.cached_property
+    def deploy_cmd(self) -> "DeployCommand":
+        """Shared DeployCommand instance"""
+        from commands.core_commands.deploy import DeployCommand
+
+        return DeployCommand()
+
+    @functools.cached_property
+    def clean_cmd(self) -> "CleanCommand":
+        """Shared CleanCommand instance"""
+        from commands.core_commands.clean import CleanCommand
+
+        return CleanCommand()
+
     # ========================================================================
     # Build Actions
     # ========================================================================
@@ -116,27 +161,16 @@ class FunctionsCommand(BaseCommand):
     def _build_all(self) -> bool:
         """Build all functions"""
         log_section("BUILD ALL FUNCTIONS")
-        build_cmd = BuildCommand()
-        return build_cmd.execute(Namespace(function=None))
+        return self.build_cmd.execute(ALL_FUNCTIONS)
 
     def _build_selected(self) -> bool:
         """Build selected functions"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select functions to build: ",
-            include_all=False,
-        )
+        functions = select_functions("Select functions to build: ")
         if not functions:
-            log_info("No functions selected")
             return False
 
         log_section(f"BUILD {len(functions)} FUNCTIONS")
-        build_cmd = BuildCommand()
-        success = True
-        for func in functions:
-            if not build_cmd.execute(Namespace(function=func)):
-                success = False
-        return success
+        return self.build_cmd.execute(FunctionArgs(function_list=functions))
 
     # ========================================================================
     # Zip Actions
@@ -145,27 +179,16 @@ class FunctionsCommand(BaseCommand):
     def _zip_all(self) -> bool:
         """Zip all functions"""
         log_section("ZIP ALL FUNCTIONS")
-        zip_cmd = ZipCommand()
-        return zip_cmd.execute(Namespace(function=None))
+        return self.zip_cmd.execute(ALL_FUNCTIONS)
 
     def _zip_selected(self) -> bool:
         """Zip selected functions"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select functions to zip: ",
-            include_all=False,
-        )
+        functions = select_functions("Select functions to zip: ")
         if not functions:
-            log_info("No functions selected")
             return False
 
         log_section(f"ZIP {len(functions)} FUNCTIONS")
-        zip_cmd = ZipCommand()
-        success = True
-        for func in functions:
-            if not zip_cmd.execute(Namespace(function=func)):
-                success = False
-        return success
+        return self.zip_cmd.execute(FunctionArgs(function_list=functions))
 
     # ========================================================================
     # Deploy Actions
@@ -174,27 +197,16 @@ class FunctionsCommand(BaseCommand):
     def _deploy_all(self) -> bool:
         """Deploy all functions"""
         log_section("DEPLOY ALL FUNCTIONS")
-        deploy_cmd = DeployCommand()
-        return deploy_cmd.execute(Namespace(function=None, skip_build=False))
+        return self.deploy_cmd.execute(ALL_FUNCTIONS)
 
     def _deploy_selected(self) -> bool:
         """Deploy selected functions"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select functions to deploy: ",
-            include_all=False,
-        )
+        functions = select_functions("Select functions to deploy: ")
         if not functions:
-            log_info("No functions selected")
             return False
 
         log_section(f"DEPLOY {len(functions)} FUNCTIONS")
-        deploy_cmd = DeployCommand()
-        success = True
-        for func in functions:
-            if not deploy_cmd.execute(Namespace(function=func, skip_build=False)):
-                success = False
-        return success
+        return self.deploy_cmd.execute(FunctionArgs(function_list=functions))
 
     # ========================================================================
     # Full Pipeline Actions
@@ -206,22 +218,19 @@ class FunctionsCommand(BaseCommand):
 
         # Build
         log_info("Step 1/3: Building...")
-        build_cmd = BuildCommand()
-        if not build_cmd.execute(Namespace(function=None)):
+        if not self.build_cmd.execute(ALL_FUNCTIONS):
             log_error("Build failed, aborting pipeline")
             return False
 
         # Zip
         log_info("Step 2/3: Zipping...")
-        zip_cmd = ZipCommand()
-        if not zip_cmd.execute(Namespace(function=None)):
+        if not self.zip_cmd.execute(ALL_FUNCTIONS):
             log_error("Zip failed, aborting pipeline")
             return False
 
         # Deploy
         log_info("Step 3/3: Deploying...")
-        deploy_cmd = DeployCommand()
-        if not deploy_cmd.execute(Namespace(function=None, skip_build=True)):
+        if not self.deploy_cmd.execute(ALL_FUNCTIONS):
             log_error("Deploy failed")
             return False
 
@@ -230,46 +239,135 @@ class FunctionsCommand(BaseCommand):
 
     def _full_pipeline_selected(self) -> bool:
         """Run full pipeline (Build → Zip → Deploy) for selected functions"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select functions for full pipeline: ",
-            include_all=False,
-        )
+        functions = select_functions("Select functions for full pipeline: ")
         if not functions:
-            log_info("No functions selected")
             return False
 
         log_section(f"FULL PIPELINE - {len(functions)} FUNCTIONS")
 
-        build_cmd = BuildCommand()
-        zip_cmd = ZipCommand()
-        deploy_cmd = DeployCommand()
-
-        success = True
-        for func in functions:
-            log_info(f"Processing {func}...")
-
-            # Build
-            if not build_cmd.execute(Namespace(function=func)):
-                log_error(f"Build failed for {func}, skipping")
-                success = False
-                continue
-
-            # Zip
-            if not zip_cmd.execute(Namespace(function=func)):
-                log_error(f"Zip failed for {func}, skipping")
-                success = False
-                continue
-
-            # Deploy
-            if not deploy_cmd.execute(Namespace(function=func, skip_build=True)):
-                log_error(f"Deploy failed for {func}")
-                success = False
+        success = self._run_pipeline(functions)
+        print_summary()
 
         if success:
             log_success("Full pipeline completed successfully")
         return success
 
+    def _run_pipeline(self, functions: List[str], fail_fast: bool = True) -> bool:
+        """
+        Stream each function through Build → Zip → Deploy independently
+
+        There are no barriers between stages: as soon as a function's build
+        finishes its zip is queued, and as soon as the zip finishes its deploy
+        is queued, while other functions are still building. Each stage has its
+        own worker pool; a failed stage drops that function from the pipeline.
+        Results are logged from the main thread so output never interleaves.
+
+        Args:
+            functions: Function names to process
+            fail_fast: After the first failure, skip every stage that hasn't started
+
+        Returns:
+            True if every function was deployed, False otherwise
+        """
+        from commands.core_commands.deploy import deploy_workers
+
+        stats.reset()
+        stats.total_functions = len(functions)
+
+        total = len(functions)
+        cpu_count = os.cpu_count() or 4
+        results: "queue.Queue[Tuple[int, str, Any]]" = queue.Queue()
+        abort = threading.Event()
+        skipped = 0
+
+        with contextlib.ExitStack() as pools:
+            build_workers = min(cpu_count, total)
+            build_env = self.build_cmd.prepare_build(build_workers)
+            # ExitStack shuts pools down in reverse order: enter them deploy-first so
+            # they drain build → zip → deploy and a finishing stage can still chain
+            deploy_ex = pools.enter_context(ThreadPoolExecutor(deploy_workers(total)))
+            zip_ex = pools.enter_context(ThreadPoolExecutor(min(32, cpu_count * 2, total)))
+            build_ex = pools.enter_context(ThreadPoolExecutor(build_workers))
+            stages = (
+                (build_ex, functools.partial(self.build_cmd.build_one, env=build_env)),
+                (zip_ex, self.zip_cmd.zip_one),
+                (deploy_ex, functools.partial(self.deploy_cmd.deploy_one, False)),
+            )
+
+            def run(stage: int, func_name: str) -> Any:
+                # Queued work checks the abort flag before starting
+                if abort.is_set():
+                    return None
+                return stages[stage][1](func_name)
+
+            def submit(stage: int, func_name: str) -> None:
+                # After an abort (failure or Ctrl+C) report the stage as skipped
+                # instead of queueing it; the pool may already be shut down
+                if not abort.is_set():
+                    try:
+                        future = stages[stage][0].submit(run, stage, func_name)
+                    except RuntimeError:
+                        pass  # Pool shut down while draining after Ctrl+C
+                    else:
+                        future.add_done_callback(lambda f: on_done(stage, func_name, f))
+                        return
+                results.put((stage, func_name, None))
+
+            def on_done(stage: int, func_name: str, future: Future) -> None:
+                error = future.exception()
+                result = error if error is not None else future.result()
+                results.put((stage, func_name, result))
+                # Chain the next stage straight from the worker thread
+                if (
+                    error is None
+                    and result is not None
+                    and result.success
+                    and stage + 1 < len(stages)
+                ):
+                    submit(stage + 1, func_name)
+
+            for func_name in functions:
+                submit(0, func_name)
+
+            remaining = total
+            try:
+                while remaining:
+                    stage, func_name, result = results.get()
+                    stage_name = _PIPELINE_STAGES[stage]
+
+                    if result is None:
+                        skipped += 1
+                        stats.add_failure(func_name)
+                        remaining -= 1
+                        continue
+
+                    if isinstance(result, BaseException):
+                        log_error(f"{stage_name} {func_name} → {result}")
+                    elif not result.success:
+                        log_error(f"{stage_name} {result.message}", result.duration)
+                        if result.detail:
+                            print(f"  {Colors.RED}Error: {result.detail}{Colors.RESET}")
+                    else:
+                        log_success(f"{stage_name} {result.message}", result.duration)
+                        if stage + 1 == len(stages):
+                            stats.add_success()
+                            remaining -= 1
+                        continue
+
+                    stats.add_failure(func_name)
+                    remaining -= 1
+                    if fail_fast:
+                        abort.set()
+            except KeyboardInterrupt:
+                # Don't let queued stages start while the pools drain
+                abort.set()
+                raise
+
+        if skipped:
+            log_warning(f"Skipped {skipped} function(s) after a failure")
+
+        return stats.failed == 0
+
     # ========================================================================
     # Clean Actions
     # ========================================================================
@@ -277,24 +375,13 @@ class FunctionsCommand(BaseCommand):
     def _clean_all(self) -> bool:
         """Clean all build artifacts"""
         log_section("CLEAN ALL BUILD ARTIFACTS")
-        clean_cmd = CleanCommand()
-        return clean_cmd.execute(Namespace(function=None))
+        return self.clean_cmd.execute(ALL_FUNCTIONS)
 
     def _clean_selected(self) -> bool:
         """Clean selected functions"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select functions to clean: ",
-            include_all=False,
-        )
+        functions = select_functions("Select functions to clean: ")
         if not functions:
-            log_info("No functions selected")
             return False
 
         log_section(f"CLEAN {len(functions)} FUNCTIONS")
-        clean_cmd = CleanCommand()
-        success = True
-        for func in functions:
-            if not clean_cmd.execute(Namespace(function=func)):
-                success = False
-        return success
+        return self.clean_cmd.execute(FunctionArgs(function_list=functions))
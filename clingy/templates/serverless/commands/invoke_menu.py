@@ -1,15 +1,19 @@
 """Invoke menu - Local and Remote Lambda invocation with payload composer"""
 
+import functools
 from argparse import ArgumentParser, Namespace
+from typing import TYPE_CHECKING
 
-from commands.core_commands.invoke import InvokeCommand
-from config import GO_FUNCTIONS
+from core.function_utils import select_functions
 
 from clingy.commands.base import BaseCommand
 from clingy.core.colors import Colors
 from clingy.core.emojis import Emoji
 from clingy.core.logger import log_error, log_info, log_section, log_success
-from clingy.core.menu import MenuNode, fzf_select_items
+from clingy.core.menu import MenuNode
+
+if TYPE_CHECKING:
+    from commands.core_commands.invoke import InvokeCommand
 
 
 class InvokeMenuCommand(BaseCommand):
@@ -29,6 +33,11 @@ class InvokeMenuCommand(BaseCommand):
 
     def get_menu_tree(self) -> MenuNode:
         """Interactive menu for function invocation"""
+        return self.menu_tree
+
+    @functools.cached_property
+    def menu_tree(self) -> MenuNode:
+        """Menu tree, built once per instance (actions are bound to self)"""
         return MenuNode(
             label="Invoke Functions",
             emoji=Emoji.RUN,
@@ -36,58 +45,49 @@ class InvokeMenuCommand(BaseCommand):
                 MenuNode(
                     label="Local Invocation",
                     emoji=Emoji.COMPUTER,
-                    action=lambda: self._invoke_local_flow(),
+                    action=functools.partial(self._invoke_flow, is_local=True),
                 ),
                 MenuNode(
                     label="Remote Invocation (AWS)",
                     emoji=Emoji.CLOUD,
-                    action=lambda: self._invoke_remote_flow(),
+                    action=functools.partial(self._invoke_flow, is_local=False),
                 ),
                 MenuNode(
                     label="Payload Navigator",
                     emoji=Emoji.DOCUMENT,
-                    action=lambda: self._browse_payloads(),
+                    action=self._browse_payloads,
                 ),
             ],
         )
 
     # ========================================================================
-    # Local Invocation Actions
+    # Commands (created on first use, then reused)
     # ========================================================================
 
-    def _invoke_local_flow(self) -> bool:
-        """Local invocation flow: select function → build payload → invoke"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select function to invoke locally: ",
-            include_all=False,
-        )
-        if not functions:
-            log_info("No function selected")
-            return False
+    @functools.cached_property
+    def invoke_cmd(self) -> "InvokeCommand":
+        """Shared InvokeCommand instance"""
+        from commands.core_commands.invoke import InvokeCommand
 
-        func = functions[0]
-        invoke_cmd = InvokeCommand()
-        return invoke_cmd.invoke_with_builder(func, is_local=True)
+        return InvokeCommand()
 
     # ========================================================================
-    # Remote Invocation Actions
+    # Invocation Actions
     # ========================================================================
 
-    def _invoke_remote_flow(self) -> bool:
-        """Remote invocation flow: select function → build payload → invoke"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select function to invoke remotely: ",
-            include_all=False,
-        )
+    def _invoke_flow(self, is_local: bool) -> bool:
+        """
+        Invocation flow: select function → build payload → invoke
+
+        Args:
+            is_local: True for local invocation, False for remote (AWS)
+        """
+        where = "locally" if is_local else "remotely"
+        functions = select_functions(f"Select function to invoke {where}: ", single=True)
         if not functions:
-            log_info("No function selected")
             return False
 
-        func = functions[0]
-        invoke_cmd = InvokeCommand()
-        return invoke_cmd.invoke_with_builder(func, is_local=False)
+        return self.invoke_cmd.invoke_with_builder(functions[0], is_local=is_local)
 
     # ========================================================================
     # Payload Navigator Actions
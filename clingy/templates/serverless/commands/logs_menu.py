@@ -1,16 +1,19 @@
 """Logs menu - View, Tail, and Insights for Lambda logs"""
 
+import functools
 from argparse import ArgumentParser, Namespace
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from commands.core_commands.insights import InsightsCommand
-from commands.core_commands.logs import LogsCommand
-from config import GO_FUNCTIONS
+from core.function_utils import ALL_FUNCTIONS, FunctionArgs, select_functions
 
 from clingy.commands.base import BaseCommand
 from clingy.core.emojis import Emoji
 from clingy.core.logger import log_info, log_section
-from clingy.core.menu import MenuNode, fzf_select_items
+from clingy.core.menu import MenuNode
+
+if TYPE_CHECKING:
+    from commands.core_commands.insights import InsightsCommand
+    from commands.core_commands.logs import LogsCommand
 
 
 class LogsMenuCommand(BaseCommand):
@@ -30,6 +33,11 @@ class LogsMenuCommand(BaseCommand):
 
     def get_menu_tree(self) -> Optional[MenuNode]:
         """Interactive menu for logs management"""
+        return self.menu_tree
+
+    @functools.cached_property
+    def menu_tree(self) -> MenuNode:
+        """Menu tree, built once per instance (actions are bound to self)"""
         return MenuNode(
             label="Logs & Monitoring",
             emoji=Emoji.SEARCH,
@@ -40,7 +48,7 @@ class LogsMenuCommand(BaseCommand):
                     children=[
                         MenuNode(
                             label="Select Function",
-                            action=lambda: self._view_logs_selected(),
+                            action=functools.partial(self._logs_selected, tail=False),
                         ),
                     ],
                 ),
@@ -50,7 +58,7 @@ class LogsMenuCommand(BaseCommand):
                     children=[
                         MenuNode(
                             label="Select Function",
-                            action=lambda: self._tail_logs_selected(),
+                            action=functools.partial(self._logs_selected, tail=True),
                         ),
                     ],
                 ),
@@ -60,7 +68,7 @@ class LogsMenuCommand(BaseCommand):
                     children=[
                         MenuNode(
                             label="Run Insights Query",
-                            action=lambda: self._run_insights(),
+                            action=self._run_insights,
                         ),
                     ],
                 ),
@@ -68,44 +76,42 @@ class LogsMenuCommand(BaseCommand):
         )
 
     # ========================================================================
-    # View Logs Actions
+    # Commands (created on first use, then reused)
     # ========================================================================
 
-    def _view_logs_selected(self) -> bool:
-        """View recent logs for selected function"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select function to view logs: ",
-            include_all=False,
-        )
-        if not functions:
-            log_info("No function selected")
-            return False
+    @functools.cached_property
+    def logs_cmd(self) -> "LogsCommand":
+        """Shared LogsCommand instance"""
+        from commands.core_commands.logs import LogsCommand
 
-        func = functions[0]  # Single selection
-        log_section(f"VIEW LOGS - {func}")
-        logs_cmd = LogsCommand()
-        return logs_cmd.execute(Namespace(function=func, tail=False, filter=None))
+        return LogsCommand()
+
+    @functools.cached_property
+    def insights_cmd(self) -> "InsightsCommand":
+        """Shared InsightsCommand instance"""
+        from commands.core_commands.insights import InsightsCommand
+
+        return InsightsCommand()
 
     # ========================================================================
-    # Tail Logs Actions
+    # View / Tail Logs Actions
     # ========================================================================
 
-    def _tail_logs_selected(self) -> bool:
-        """Tail live logs for selected function"""
-        functions = fzf_select_items(
-            items=GO_FUNCTIONS,
-            prompt="Select function to tail logs: ",
-            include_all=False,
-        )
+    def _logs_selected(self, tail: bool) -> bool:
+        """
+        View recent logs or tail live logs for a selected function
+
+        Args:
+            tail: True to follow live logs, False to show recent logs
+        """
+        verb = "tail" if tail else "view"
+        functions = select_functions(f"Select function to {verb} logs: ", single=True)
         if not functions:
-            log_info("No function selected")
             return False
 
         func = functions[0]  # Single selection
-        log_section(f"TAIL LOGS - {func}")
-        logs_cmd = LogsCommand()
-        return logs_cmd.execute(Namespace(function=func, tail=True, filter=None))
+        log_section(f"{verb.upper()} LOGS - {func}")
+        return self.logs_cmd.execute(FunctionArgs(function=func))
 
     # ========================================================================
     # Insights Actions
@@ -114,6 +120,5 @@ class LogsMenuCommand(BaseCommand):
     def _run_insights(self) -> bool:
         """Run CloudWatch Insights query"""
         log_section("CLOUDWATCH INSIGHTS")
-        insights_cmd = InsightsCommand()
         # Use interactive mode (no function specified)
-        return insights_cmd.execute(Namespace(function=None, query=None))
+        return self.insights_cmd.execute(ALL_FUNCTIONS)
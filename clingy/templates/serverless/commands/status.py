@@ -1,9 +1,13 @@
 """Status command - Show Lambda functions status and configuration"""
 
+import functools
 import os
+import platform
 import subprocess
+import time
 from argparse import ArgumentParser, Namespace
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
 
 from config import (
     AWS_PROFILE,
@@ -16,19 +20,86 @@ from config import (
     SERVERLESS_STAGE,
     SERVICE_NAME,
 )
+from core.function_utils import GO_FUNCTIONS_SET
 
 from clingy.commands.base import BaseCommand
 from clingy.core.colors import Colors
+from clingy.core.dependency import Dependency
 from clingy.core.emojis import Emoji
 from clingy.core.logger import (
     log_error,
     log_header,
     log_info,
+    log_lines,
     log_section,
     log_success,
 )
 from clingy.core.menu import MenuNode
 
+# Dependency probe results are reused for this many seconds (repeated menu clicks)
+_DEPENDENCY_CACHE_TTL = 5.0
+
+# Dependency field with the install command for this OS (None: only install_other)
+_INSTALL_ATTR = {"Darwin": "install_macos", "Linux": "install_linux"}.get(platform.system())
+
+
+def _install_hint(dep: Dependency) -> Optional[str]:
+    """
+    Install command for a dependency on this OS
+
+    Args:
+        dep: Dependency to install
+
+    Returns:
+        OS-specific install command, else the generic one (None if neither is set)
+    """
+    return (_INSTALL_ATTR and getattr(dep, _INSTALL_ATTR)) or dep.install_other
+
+
+def _find_file(parent: str, wanted: AbstractSet[str], filename: str) -> Dict[str, os.DirEntry]:
+    """
+    Find `filename` inside the `wanted` subdirectories of `parent`
+
+    Uses os.scandir, so file types come from the directory listing itself
+    instead of one stat per path.
+
+    Args:
+        parent: Directory holding one subdirectory per function
+        wanted: Subdirectory names to look in
+        filename: File to look for in each subdirectory
+
+    Returns:
+        Subdirectory name -> DirEntry of the file (missing ones are omitted)
+    """
+    found = {}
+    try:
+        with os.scandir(parent) as entries:
+            subdirs = [e for e in entries if e.name in wanted and e.is_dir()]
+        for subdir in subdirs:
+            with os.scandir(subdir.path) as entries:
+                for entry in entries:
+                    if entry.name == filename and entry.is_file():
+                        found[subdir.name] = entry
+                        break
+    except OSError:
+        pass
+    return found
+
+
+def _scan_functions() -> Tuple[Set[str], Dict[str, int]]:
+    """
+    Scan FUNCTIONS_DIR and BIN_DIR once for every function in GO_FUNCTIONS
+
+    Returns:
+        (functions with a main.go, function -> bootstrap size in bytes)
+    """
+    sources = set(_find_file(FUNCTIONS_DIR, GO_FUNCTIONS_SET, "main.go"))
+    binaries = {
+        name: entry.stat().st_size
+        for name, entry in _find_file(BIN_DIR, GO_FUNCTIONS_SET, "bootstrap").items()
+    }
+    return sources, binaries
+
 
 class StatusCommand(BaseCommand):
     """Show Lambda functions status and configuration"""
@@ -37,6 +108,9 @@ class StatusCommand(BaseCommand):
     help = "Show functions status"
     description = "Display Lambda functions status, build status, dependencies, and configuration"
 
+    # (time.monotonic() of the last probe run, results in DEPENDENCIES order)
+    _dependency_probes: Optional[Tuple[float, List[Tuple[str, str]]]] = None
+
     def execute(self, args: Namespace) -> bool:
         """Execute status command"""
         log_header("SERVERLESS STATUS")
@@ -55,27 +129,27 @@ class StatusCommand(BaseCommand):
                 MenuNode(
                     label="List All Functions",
                     emoji=Emoji.LIST,
-                    action=lambda: self._list_functions(),
+                    action=self._list_functions,
                 ),
                 MenuNode(
                     label="Build Status",
                     emoji=Emoji.BUILD,
-                    action=lambda: self._show_build_status(),
+                    action=self._show_build_status,
                 ),
                 MenuNode(
                     label="Check Dependencies",
                     emoji=Emoji.PACKAGE,
-                    action=lambda: self._check_dependencies(),
+                    action=self._check_dependencies,
                 ),
                 MenuNode(
                     label="Show Configuration",
                     emoji=Emoji.GEAR,
-                    action=lambda: self._show_config(),
+                    action=self._show_config,
                 ),
                 MenuNode(
                     label="Show All Status",
                     emoji=Emoji.INFO,
-                    action=lambda: self._show_all_status(),
+                    action=self._show_all_status,
                 ),
             ],
         )
@@ -88,19 +162,15 @@ class StatusCommand(BaseCommand):
         """List all Lambda functions"""
         log_section(f"LAMBDA FUNCTIONS ({len(GO_FUNCTIONS)} total)")
 
+        # One line per function, printed in a single batch
+        lines = []
+        sources, binaries = _scan_functions()
         for i, func in enumerate(GO_FUNCTIONS, 1):
-            # Check if source exists
-            source_path = os.path.join(FUNCTIONS_DIR, func, "main.go")
-            source_exists = os.path.exists(source_path)
-
-            # Check if binary exists
-            binary_path = os.path.join(BIN_DIR, func, "bootstrap")
-            binary_exists = os.path.exists(binary_path)
-
-            status_icon = "✅" if source_exists else "❌"
-            build_icon = "📦" if binary_exists else "⚠️"
+            status_icon = "✅" if func in sources else "❌"
+            build_icon = "📦" if func in binaries else "⚠️"
 
-            log_info(f"{i:3d}. {status_icon} {build_icon} {func}")
+            lines.append(("info", f"{i:3d}. {status_icon} {build_icon} {func}"))
+        log_lines(lines)
 
         log_info(f"\nLegend: ✅ Source exists | 📦 Built | ⚠️ Not built | ❌ Missing source")
         return True
@@ -113,24 +183,20 @@ class StatusCommand(BaseCommand):
         not_built_count = 0
         missing_source_count = 0
 
+        # One line per function, printed in a single batch
+        lines = []
+        sources, binaries = _scan_functions()
         for func in GO_FUNCTIONS:
-            source_path = os.path.join(FUNCTIONS_DIR, func, "main.go")
-            binary_path = os.path.join(BIN_DIR, func, "bootstrap")
-
-            source_exists = os.path.exists(source_path)
-            binary_exists = os.path.exists(binary_path)
-
-            if not source_exists:
-                log_error(f"{func} → Missing source (main.go)")
+            if func not in sources:
+                lines.append(("error", f"{func} → Missing source (main.go)"))
                 missing_source_count += 1
-            elif binary_exists:
-                # Get binary size
-                size = os.path.getsize(binary_path)
-                log_success(f"{func} → Built ({size:,} bytes)")
+            elif func in binaries:
+                lines.append(("success", f"{func} → Built ({binaries[func]:,} bytes)"))
                 built_count += 1
             else:
-                log_info(f"{func} → Not built")
+                lines.append(("info", f"{func} → Not built"))
                 not_built_count += 1
+        log_lines(lines)
 
         # Summary
         log_section("SUMMARY")
@@ -141,34 +207,74 @@ class StatusCommand(BaseCommand):
 
         return True
 
+    def _probe_dependency(self, dep: Dependency) -> Tuple[str, str]:
+        """
+        Run a dependency's version check (runs in a worker thread, no logging)
+
+        Args:
+            dep: Dependency to probe
+
+        Returns:
+            (status, detail) where status is "ok", "failed", "missing" or "timeout"
+            and detail is the first line of the version output for "ok"
+        """
+        try:
+            result = subprocess.run(
+                [dep.command, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+        except FileNotFoundError:
+            return "missing", ""
+        except subprocess.TimeoutExpired:
+            return "timeout", ""
+
+        if result.returncode != 0:
+            return "failed", ""
+        return "ok", result.stdout.strip().split("\n")[0]
+
+    def _probe_dependencies(self) -> List[Tuple[str, str]]:
+        """
+        Probe every dependency, reusing results younger than _DEPENDENCY_CACHE_TTL
+
+        Returns:
+            (status, detail) per dependency, in DEPENDENCIES order
+        """
+        if self._dependency_probes is not None:
+            probed_at, probes = self._dependency_probes
+            if time.monotonic() - probed_at < _DEPENDENCY_CACHE_TTL:
+                return probes
+
+        # Probes are independent, so run them all at once (wall time ≈ slowest probe)
+        with ThreadPoolExecutor(max_workers=min(8, len(DEPENDENCIES)) or 1) as executor:
+            probes = list(executor.map(self._probe_dependency, DEPENDENCIES))
+
+        self._dependency_probes = (time.monotonic(), probes)
+        return probes
+
     def _check_dependencies(self) -> bool:
         """Check required system dependencies"""
         log_section("SYSTEM DEPENDENCIES")
 
         all_ok = True
-        for dep in DEPENDENCIES:
-            try:
-                # Try to run the command
-                result = subprocess.run(
-                    [dep.command, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    version = result.stdout.strip().split("\n")[0]
-                    log_success(f"{dep.name} → {version}")
-                else:
-                    log_error(f"{dep.name} → Not found")
-                    log_info(f"  Install: {dep.install_macos or dep.install_linux}")
-                    all_ok = False
-            except FileNotFoundError:
-                log_error(f"{dep.name} → Not installed")
-                log_info(f"  Install: {dep.install_macos or dep.install_linux}")
-                all_ok = False
-            except subprocess.TimeoutExpired:
-                log_error(f"{dep.name} → Timeout")
-                all_ok = False
+        lines = []
+        for dep, (status, detail) in zip(DEPENDENCIES, self._probe_dependencies()):
+            if status == "ok":
+                lines.append(("success", f"{dep.name} → {detail}"))
+                continue
+
+            all_ok = False
+            if status == "timeout":
+                lines.append(("error", f"{dep.name} → Timeout"))
+                continue
+
+            problem = "Not installed" if status == "missing" else "Not found"
+            lines.append(("error", f"{dep.name} → {problem}"))
+            hint = _install_hint(dep)
+            if hint:
+                lines.append(("info", f"  Install: {hint}"))
+        log_lines(lines)
 
         if all_ok:
             log_success("\nAll dependencies are installed")
@@ -177,20 +283,36 @@ class StatusCommand(BaseCommand):
 
         return all_ok
 
+    @functools.cached_property
+    def _config_lines(self) -> List[Tuple[str, str]]:
+        """Configuration lines (config is static for the process, so formatted once)"""
+        settings = [
+            ("Environment", ENV),
+            ("AWS Profile", AWS_PROFILE),
+            ("Service Name", SERVICE_NAME),
+            ("Serverless Stage", SERVERLESS_STAGE),
+            ("Functions Directory", FUNCTIONS_DIR),
+            ("Binary Directory", BIN_DIR),
+        ]
+        return [
+            ("info", f"{label}: {Colors.CYAN}{value}{Colors.RESET}") for label, value in settings
+        ]
+
+    @functools.cached_property
+    def _build_settings_lines(self) -> List[Tuple[str, str]]:
+        """BUILD_SETTINGS lines, formatted once"""
+        return [
+            ("info", f"{key}: {Colors.CYAN}{value}{Colors.RESET}")
+            for key, value in BUILD_SETTINGS.items()
+        ]
+
     def _show_config(self) -> bool:
         """Show current configuration"""
         log_section("CONFIGURATION")
-
-        log_info(f"Environment: {Colors.CYAN}{ENV}{Colors.RESET}")
-        log_info(f"AWS Profile: {Colors.CYAN}{AWS_PROFILE}{Colors.RESET}")
-        log_info(f"Service Name: {Colors.CYAN}{SERVICE_NAME}{Colors.RESET}")
-        log_info(f"Serverless Stage: {Colors.CYAN}{SERVERLESS_STAGE}{Colors.RESET}")
-        log_info(f"Functions Directory: {Colors.CYAN}{FUNCTIONS_DIR}{Colors.RESET}")
-        log_info(f"Binary Directory: {Colors.CYAN}{BIN_DIR}{Colors.RESET}")
+        log_lines(self._config_lines)
 
         log_section("BUILD SETTINGS")
-        for key, value in BUILD_SETTINGS.items():
-            log_info(f"{key}: {Colors.CYAN}{value}{Colors.RESET}")
+        log_lines(self._build_settings_lines)
 
         return True
 
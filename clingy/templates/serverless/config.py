@@ -62,18 +62,42 @@ BIN_DIR = os.path.join(PROJECT_ROOT, ".bin")
 SERVERLESS_STAGE = ENV
 SERVERLESS_PROFILE = AWS_PROFILE
 
+# Method for code-only deploys of individual functions: "serverless" or "boto3"
+# - "serverless": Use 'serverless deploy function -f <function>' (requires serverless framework)
+# - "boto3": Upload the built zip with UpdateFunctionCode through one shared Lambda
+#   client (requires: pip install boto3). Functions whose deployed CodeSha256
+#   already matches the zip are skipped ('deploy --force' uploads anyway)
+# Full-stack deploys (all functions) always use 'serverless deploy'.
+DEPLOY_FUNCTION_METHOD = "serverless"
+
 
 # ============================================================================
 # Invoke Settings
 # ============================================================================
-# Method for remote invocation: "serverless" or "aws-cli"
+# Method for remote invocation: "serverless", "aws-cli" or "boto3"
 # - "serverless": Use 'serverless invoke -f <function>' (requires serverless framework)
 # - "aws-cli": Use 'aws lambda invoke' directly (requires AWS CLI)
+# - "boto3": Call Lambda in-process with a cached client (requires: pip install boto3)
 INVOKE_REMOTE_METHOD = "serverless"
 
-# AWS region for Lambda invocations (only used with aws-cli method)
+# AWS region for Lambda API calls (aws-cli/boto3 invokes, async invokes and boto3 deploys)
 INVOKE_AWS_REGION = "us-west-2"
 
+# Async remote invocations ("Invoke async ... (no wait)") use boto3 with
+# InvocationType=Event and return as soon as AWS accepts the event.
+# Requires: pip install boto3
+
+
+# ============================================================================
+# Logs Settings
+# ============================================================================
+# Method for the "Filter logs with custom query" option: "filter" or "insights"
+# - "filter": CloudWatch filter pattern over the last 30 minutes (same as 'aws logs tail
+#   --filter-pattern'), e.g. ERROR, "?ERROR ?WARN", { $.level = "error" }
+# - "insights": Substring search in @message with a Logs Insights query, run server-side
+#   (requires: pip install boto3; falls back to "filter" without it)
+LOGS_QUERY_METHOD = "filter"
+
 
 # ============================================================================
 # Payload Settings
@@ -0,0 +1,87 @@
+"""
+Cached boto3 clients for in-process AWS calls.
+
+Creating a boto3 session resolves credentials and loads service models, which
+is slow compared to the API call itself. Clients are built once per process
+and reused by every command; they are safe to share across worker threads.
+
+boto3 is optional: commands check BOTO3_AVAILABLE and fall back to the AWS CLI
+(or explain how to install boto3) when it is missing.
+"""
+
+import functools
+import threading
+from typing import Any, Optional
+
+from config import AWS_PROFILE
+
+try:
+    import boto3
+    from botocore.config import Config
+
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+# botocore's default HTTPS connection pool size per client
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# boto3 sessions are not thread-safe; clients may be requested from worker threads
+_CLIENT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+    retry_mode: Optional[str] = None,
+    total_max_attempts: Optional[int] = None,
+    read_timeout: Optional[int] = None,
+) -> Any:
+    """
+    Get a cached boto3 client for AWS_PROFILE.
+
+    Clients are cached per argument combination, so callers that need a
+    different retry policy or timeout get their own client.
+
+    Args:
+        service_name: AWS service name (e.g., "lambda", "logs")
+        region_name: AWS region (None uses the profile's default region)
+        max_pool_connections: Size of the client's HTTPS connection pool; should
+            be at least the number of threads sharing the client
+        retry_mode: botocore retry mode ("legacy", "standard", "adaptive");
+            None keeps botocore's default
+        total_max_attempts: Attempts per request including the first one
+            (1 disables retries); None keeps botocore's default
+        read_timeout: Socket read timeout in seconds; None keeps botocore's 60s
+
+    Returns:
+        boto3 client for the service
+
+    Raises:
+        ImportError: If boto3 is not installed
+
+    Example:
+        >>> client = get_client("lambda", "us-west-2")
+        >>> client.invoke(FunctionName="my-fn", InvocationType="Event")
+    """
+    if not BOTO3_AVAILABLE:
+        raise ImportError("boto3 is not installed. Install with: pip install boto3")
+
+    retries = {}
+    if retry_mode is not None:
+        retries["mode"] = retry_mode
+    if total_max_attempts is not None:
+        retries["total_max_attempts"] = total_max_attempts
+
+    options = {"max_pool_connections": max_pool_connections}
+    if retries:
+        options["retries"] = retries
+    if read_timeout is not None:
+        options["read_timeout"] = read_timeout
+
+    config = Config(**options)
+    with _CLIENT_LOCK:
+        session = boto3.Session(profile_name=AWS_PROFILE)
+        return session.client(service_name, region_name=region_name, config=config)
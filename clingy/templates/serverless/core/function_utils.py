@@ -1,11 +1,48 @@
 """Utility functions for Lambda function management"""
 
+import functools
 from argparse import Namespace
-from typing import List
+from typing import List, NamedTuple, Optional, Sequence
 
-from config import GO_FUNCTIONS
+from config import GO_FUNCTIONS, SERVERLESS_STAGE, SERVICE_NAME
 
 from clingy.core.logger import log_error, log_info
+from clingy.core.menu import fzf_select_items
+
+
+class FunctionArgs(NamedTuple):
+    """
+    Arguments for running a core command from the interactive menus
+
+    Read by commands exactly like an argparse Namespace (args.function,
+    getattr(args, "debug", False), ...), but immutable and tuple-backed, so
+    shared instances such as ALL_FUNCTIONS can be reused for every call.
+    """
+
+    function: Optional[str] = None
+    function_list: Optional[Sequence[str]] = None
+    keep_going: bool = False
+
+
+# All functions in GO_FUNCTIONS (no --function)
+ALL_FUNCTIONS = FunctionArgs()
+
+# O(1) membership checks; GO_FUNCTIONS stays the ordered list for iteration
+GO_FUNCTIONS_SET = frozenset(GO_FUNCTIONS)
+
+
+@functools.lru_cache(maxsize=256)
+def build_lambda_name(func_name: str) -> str:
+    """
+    Build (and memoize) the deployed Lambda name for a short function name
+
+    Args:
+        func_name: Function name from GO_FUNCTIONS
+
+    Returns:
+        Full Lambda name ({SERVICE_NAME}-{SERVERLESS_STAGE}-{func_name})
+    """
+    return f"{SERVICE_NAME}-{SERVERLESS_STAGE}-{func_name}"
 
 
 def resolve_function_list(args: Namespace) -> List[str]:
@@ -13,7 +50,7 @@ def resolve_function_list(args: Namespace) -> List[str]:
     Resolve function list from args (supports CLI and interactive modes)
 
     Args:
-        args: Parsed arguments with optional 'function' attribute
+        args: Parsed arguments with optional 'function' or 'function_list' attribute
 
     Returns:
         List of function names to process
@@ -28,15 +65,48 @@ def resolve_function_list(args: Namespace) -> List[str]:
         >>> args = Namespace(function=None)
         >>> resolve_function_list(args)
         ['func1', 'func2', ...]  # All functions from GO_FUNCTIONS
+
+        >>> # Interactive mode with a pre-selected list
+        >>> args = Namespace(function=None, function_list=["status", "getClientes"])
+        >>> resolve_function_list(args)
+        ['status', 'getClientes']
     """
     # CLI mode: specific function via --function flag
     if hasattr(args, "function") and args.function:
-        if args.function in GO_FUNCTIONS:
+        if args.function in GO_FUNCTIONS_SET:
             return [args.function]
         else:
             log_error(f"Function '{args.function}' not found in GO_FUNCTIONS")
             log_info(f"Available: {', '.join(GO_FUNCTIONS[:5])}...")
             return []
 
+    # Interactive mode: explicit list (e.g., picked with fzf)
+    function_list = getattr(args, "function_list", None)
+    if function_list:
+        return list(function_list)
+
     # Default: all functions
     return GO_FUNCTIONS
+
+
+def select_functions(prompt: str, single: bool = False) -> Optional[List[str]]:
+    """
+    Pick functions from GO_FUNCTIONS with fzf (shared by the interactive menus)
+
+    Args:
+        prompt: fzf prompt text
+        single: Only the first selection is used (affects the "nothing picked" message)
+
+    Returns:
+        Selected function names, or None if nothing was selected
+    """
+    # Nothing to choose from: skip spawning fzf
+    if len(GO_FUNCTIONS) == 1:
+        log_info(f"Using the only configured function: {GO_FUNCTIONS[0]}")
+        return list(GO_FUNCTIONS)
+
+    functions = fzf_select_items(items=GO_FUNCTIONS, prompt=prompt, include_all=False)
+    if not functions:
+        log_info("No function selected" if single else "No functions selected")
+        return None
+    return functions
@@ -7,6 +7,8 @@ Handles:
 - Format statistics
 """
 
+import csv
+import io
 import json
 import os
 from pathlib import Path
@@ -24,6 +26,9 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+# Write buffer for CSV exports (large result sets go out in few syscalls)
+_CSV_BUFFER_SIZE = 1024 * 1024
+
 
 def format_results_table(results: List[List[Dict]], statistics: Dict) -> str:
     """
@@ -92,51 +97,49 @@ def _format_simple(results: List[List[Dict]], statistics: Dict) -> str:
     # Extract field names (exclude @ptr - it's noise)
     field_names = [item["field"] for item in results[0] if item["field"] != "@ptr"]
 
-    # Calculate column widths with max limit
+    # Stringify (and truncate) every cell once, tracking value widths in the same pass
     MAX_COL_WIDTH = 60  # Prevent columns from being too wide
-    col_widths = {}
-    for field in field_names:
-        col_widths[field] = len(field)
-
-    for row in results:
-        for item in row:
-            field = item["field"]
-            if field == "@ptr":  # Skip @ptr field
-                continue
-            value = str(item["value"])
-            # Limit width to MAX_COL_WIDTH
-            col_widths[field] = min(max(col_widths[field], len(value)), MAX_COL_WIDTH)
-
-    # Build table
-    output = []
-
-    # Header
-    header_parts = []
-    separator_parts = []
-    for field in field_names:
-        width = col_widths[field]
-        header_parts.append(field.ljust(width))
-        separator_parts.append("-" * width)
-
-    output.append(" | ".join(header_parts))
-    output.append("-+-".join(separator_parts))
-
-    # Rows
+    value_widths: Dict[str, int] = {}
+    rendered = []
     for row in results:
-        row_parts = []
+        fields = []
+        values = []
         for item in row:
             field = item["field"]
             if field == "@ptr":  # Skip @ptr field
                 continue
             value = str(item["value"])
-            width = col_widths[field]
-
-            # Truncate if too long
-            if len(value) > MAX_COL_WIDTH:
+            length = len(value)
+            if length > MAX_COL_WIDTH:
                 value = value[: MAX_COL_WIDTH - 3] + "..."
+                length = MAX_COL_WIDTH
+            if length > value_widths.get(field, -1):
+                value_widths[field] = length
+            fields.append(field)
+            values.append(value)
+        rendered.append((fields, values))
+
+    # Column width: header or widest value, limited to MAX_COL_WIDTH once it has values
+    col_widths = {
+        field: (
+            min(max(len(field), value_widths[field]), MAX_COL_WIDTH)
+            if field in value_widths
+            else len(field)
+        )
+        for field in field_names
+    }
 
-            row_parts.append(value.ljust(width))
-        output.append(" | ".join(row_parts))
+    # Build table
+    output = [
+        " | ".join([field.ljust(col_widths[field]) for field in field_names]),
+        "-+-".join(["-" * col_widths[field] for field in field_names]),
+    ]
+    output.extend(
+        [
+            " | ".join([value.ljust(col_widths[field]) for field, value in zip(fields, values)])
+            for fields, values in rendered
+        ]
+    )
 
     # Statistics
     output.append("\n" + _format_statistics(statistics))
@@ -203,15 +206,21 @@ def save_results_yaml(
                     clean_row[field] = value
             clean_results.append(clean_row)
 
+        # Metadata values, computed once for either output format
+        executed_at = datetime.now().isoformat()
+        records_matched = int(statistics.get("recordsMatched", 0))
+        records_scanned = int(statistics.get("recordsScanned", 0))
+        bytes_scanned = statistics.get("bytesScanned", 0)
+
         # Prepare data with metadata
         output_data = {
             "query_metadata": {
                 "query_name": query_name,
                 "function": func_name,
-                "executed_at": datetime.now().isoformat(),
-                "records_matched": int(statistics.get("recordsMatched", 0)),
-                "records_scanned": int(statistics.get("recordsScanned", 0)),
-                "bytes_scanned": statistics.get("bytesScanned", 0),
+                "executed_at": executed_at,
+                "records_matched": records_matched,
+                "records_scanned": records_scanned,
+                "bytes_scanned": bytes_scanned,
             },
             "results": clean_results,
         }
@@ -220,34 +229,36 @@ def save_results_yaml(
         output_file = func_folder / "insights-result.yaml"
 
         # Try to use PyYAML if available, otherwise fallback to manual YAML
-        try:
-            import yaml
+        from core.yaml_compat import YAML_AVAILABLE, safe_dump
 
+        if YAML_AVAILABLE:
             with open(output_file, "w", encoding="utf-8") as f:
-                yaml.dump(
+                safe_dump(
                     output_data,
                     f,
                     default_flow_style=False,
                     allow_unicode=True,
                     sort_keys=False,
                 )
-        except ImportError:
-            # Manual YAML formatting (fallback)
+        else:
+            # Manual YAML formatting (fallback), built in memory and written once
+            buf = io.StringIO()
+            buf.write("# CloudWatch Insights Query Results\n")
+            buf.write(f"# Generated: {executed_at}\n\n")
+            buf.write("query_metadata:\n")
+            buf.write(f"  query_name: {query_name}\n")
+            buf.write(f"  function: {func_name}\n")
+            buf.write(f"  executed_at: {executed_at}\n")
+            buf.write(f"  records_matched: {records_matched}\n")
+            buf.write(f"  records_scanned: {records_scanned}\n")
+            buf.write(f"  bytes_scanned: {bytes_scanned}\n\n")
+            buf.write("results:\n")
+            for row in clean_results:
+                items = [f"{k}: {repr(v)}" for k, v in row.items()]
+                buf.write("  - {" + ", ".join(items) + "}\n")
+
             with open(output_file, "w", encoding="utf-8") as f:
-                f.write("# CloudWatch Insights Query Results\n")
-                f.write(f"# Generated: {datetime.now().isoformat()}\n\n")
-                f.write("query_metadata:\n")
-                f.write(f"  query_name: {query_name}\n")
-                f.write(f"  function: {func_name}\n")
-                f.write(f"  executed_at: {datetime.now().isoformat()}\n")
-                f.write(f"  records_matched: {int(statistics.get('recordsMatched', 0))}\n")
-                f.write(f"  records_scanned: {int(statistics.get('recordsScanned', 0))}\n")
-                f.write(f"  bytes_scanned: {statistics.get('bytesScanned', 0)}\n\n")
-                f.write("results:\n")
-                for row in clean_results:
-                    f.write("  - ")
-                    items = [f"{k}: {repr(v)}" for k, v in row.items()]
-                    f.write("{" + ", ".join(items) + "}\n")
+                f.write(buf.getvalue())
 
         return output_file.resolve()
 
@@ -281,16 +292,12 @@ def save_results_csv(results: List[List[Dict]], func_name: str) -> Optional[Path
         # Extract field names
         field_names = [item["field"] for item in results[0]]
 
-        # Write CSV
+        # Write CSV (csv handles quoting of commas, quotes and newlines)
         output_file = func_folder / "insights-result.csv"
-        with open(output_file, "w", encoding="utf-8") as f:
-            # Header
-            f.write(",".join(field_names) + "\n")
-
-            # Rows
-            for row in results:
-                values = [item["value"].replace(",", ";") for item in row]  # Escape commas
-                f.write(",".join(values) + "\n")
+        with open(output_file, "w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(field_names)
+            writer.writerows([item["value"] for item in row] for row in results)
 
         return output_file.resolve()
 
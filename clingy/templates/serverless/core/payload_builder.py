@@ -82,17 +82,18 @@ class PayloadBuilder:
     - Merge order matters (last selection wins on conflicts)
     """
 
-    def __init__(self, payloads_dir: Path, stage: str):
+    def __init__(self, payloads_dir: Path, stage: str, composer: Optional[PayloadComposer] = None):
         """
         Initialize builder.
 
         Args:
             payloads_dir: Root payloads directory
             stage: Current stage (dev/prod) for base context merging
+            composer: Composer to reuse (keeps its parsed-file cache); None creates one
         """
         self.payloads_dir = Path(payloads_dir)
         self.stage = stage
-        self.composer = PayloadComposer(payloads_dir)
+        self.composer = composer or PayloadComposer(payloads_dir)
         self.selections: List[SnippetSelection] = []
 
     def build_interactive(self) -> Optional[Path]:
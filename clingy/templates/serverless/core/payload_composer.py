@@ -4,17 +4,23 @@ Payload Composer - Sistema de composición de payloads YAML/JSON
 Permite componer payloads Lambda desde múltiples archivos base con merge profundo.
 """
 
+import copy
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-try:
+from core.yaml_compat import YAML_AVAILABLE, safe_load
+
+if YAML_AVAILABLE:
     import yaml
 
-    YAML_AVAILABLE = True
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
 except ImportError:
-    YAML_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 
 # ============================================================================
@@ -27,6 +33,25 @@ REQUIRED_LAMBDA_FIELDS = ["version", "routeKey", "rawPath"]
 
 RECOMMENDED_FIELDS = ["requestContext", "headers"]
 
+# Tipos aceptados para el campo body
+_BODY_TYPES = (str, dict, list, type(None))
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _loads_json(raw: bytes):
+    """Parsea JSON desde bytes, con orjson si está disponible."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson es más estricto (NaN, ints > 64 bits); json decide y reporta el error
+            pass
+    return json.loads(raw)
+
 
 # ============================================================================
 # Data Classes
@@ -84,6 +109,12 @@ class PayloadComposer:
         """
         self.payloads_dir = Path(payloads_dir)
         self.base_dir = self.payloads_dir / "_base"
+        # Path -> ((st_mtime_ns, st_size), datos parseados)
+        self._parse_cache: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+
+    def clear_cache(self) -> None:
+        """Descarta los archivos parseados en memoria."""
+        self._parse_cache.clear()
 
     def deep_merge(self, base: dict, override: dict, depth: int = 0) -> dict:
         """
@@ -108,39 +139,34 @@ class PayloadComposer:
         Raises:
             PayloadError: Si se excede la profundidad máxima
         """
-        if depth > MAX_MERGE_DEPTH:
-            raise PayloadError(
-                f"Max merge depth ({MAX_MERGE_DEPTH}) exceeded. "
-                "Possible circular reference or overly nested structure."
-            )
-
         result = base.copy()
+        # Pila de trabajo: (dict del resultado, override a aplicar, profundidad).
+        # Cada dict que se mergea se copia (superficialmente) antes de escribir
+        # en él, así base nunca se modifica y no hay recursión por nivel.
+        stack = [(result, override, depth)]
+
+        while stack:
+            dst, src, level = stack.pop()
+            if level > MAX_MERGE_DEPTH:
+                raise PayloadError(
+                    f"Max merge depth ({MAX_MERGE_DEPTH}) exceeded. "
+                    "Possible circular reference or overly nested structure."
+                )
 
-        for key, override_value in override.items():
-            if key in result:
-                base_value = result[key]
-
-                # Si override es None, eliminar la key
+            for key, override_value in src.items():
+                # Si override es None, eliminar la key (o no agregarla)
                 if override_value is None:
-                    del result[key]
-                    continue
+                    dst.pop(key, None)
 
-                # Si base es None, usar override directamente
-                if base_value is None:
-                    result[key] = override_value
-                    continue
+                # Caso 1: Ambos son dict → merge sobre una copia
+                elif isinstance(override_value, dict) and isinstance(dst.get(key), dict):
+                    merged = dst[key].copy()
+                    dst[key] = merged
+                    stack.append((merged, override_value, level + 1))
 
-                # Caso 1: Ambos son dict → merge recursivo
-                if isinstance(base_value, dict) and isinstance(override_value, dict):
-                    result[key] = self.deep_merge(base_value, override_value, depth + 1)
-
-                # Caso 2 y 3: Override reemplaza
+                # Caso 2, 3 y 4: Override reemplaza (o key nueva / base None)
                 else:
-                    result[key] = override_value
-            else:
-                # Caso 4: Key nueva (solo agregar si no es None)
-                if override_value is not None:
-                    result[key] = override_value
+                    dst[key] = override_value
 
         return result
 
@@ -166,7 +192,7 @@ class PayloadComposer:
 
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
 
                 # Archivo vacío
                 if data is None:
@@ -205,13 +231,13 @@ class PayloadComposer:
             raise PayloadError(f"File not found: {path}")
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = _loads_json(f.read())
 
-                if not isinstance(data, dict):
-                    raise PayloadError(f"JSON must be a dictionary, got {type(data).__name__}")
+            if not isinstance(data, dict):
+                raise PayloadError(f"JSON must be a dictionary, got {type(data).__name__}")
 
-                return data
+            return data
 
         except json.JSONDecodeError as e:
             raise PayloadError(
@@ -222,21 +248,40 @@ class PayloadComposer:
         """
         Carga archivo YAML o JSON según extensión.
 
+        El resultado parseado se cachea por (mtime, tamaño): los archivos base
+        (general, context, _metadata) se reutilizan entre composiciones y solo
+        se vuelven a parsear si cambian en disco.
+
         Args:
             path: Ruta al archivo
 
         Returns:
-            Diccionario con el contenido del archivo
+            Diccionario con el contenido del archivo (copia propia del llamador)
         """
         if path.suffix in [".yaml", ".yml"]:
-            return self.load_yaml_safe(path)
+            loader = self.load_yaml_safe
         elif path.suffix == ".json":
-            return self.load_json_safe(path)
+            loader = self.load_json_safe
         else:
             raise PayloadError(
                 f"Unsupported file format: {path.suffix}. " "Use .yaml, .yml, or .json"
             )
 
+        try:
+            st = path.stat()
+        except OSError:
+            # El loader reporta el error (archivo no encontrado)
+            return loader(path)
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._parse_cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, loader(path))
+            self._parse_cache[path] = cached
+
+        # deep_merge solo copia superficialmente: nunca entregar el dict cacheado
+        return copy.deepcopy(cached[1])
+
     def compose(self, selected_file: Path, stage: str) -> ComposedPayload:
         """
         Compone el payload final mergeando archivos en orden.
@@ -420,7 +465,7 @@ class PayloadComposer:
         # Validar body si existe
         if "body" in payload:
             body = payload["body"]
-            if not isinstance(body, (str, dict, list, type(None))):
+            if not isinstance(body, _BODY_TYPES):
                 errors.append(
                     f"Body must be string, dict, list, or null. " f"Got: {type(body).__name__}"
                 )
@@ -41,3 +41,27 @@ def run_in_project_root(command: List[str], **kwargs: Any) -> subprocess.Complet
     kwargs.setdefault("cwd", PROJECT_ROOT)
 
     return subprocess.run(command, **kwargs)
+
+
+def popen_in_project_root(command: List[str], **kwargs: Any) -> subprocess.Popen:
+    """
+    Start subprocess command from PROJECT_ROOT without waiting for it.
+
+    Use this instead of run_in_project_root() when output must be consumed
+    while the command is still running (e.g., streaming logs).
+
+    Args:
+        command: List of command and arguments (e.g., ["aws", "logs", "tail", ...])
+        **kwargs: Additional arguments for subprocess.Popen()
+
+    Returns:
+        Popen instance (use as a context manager to ensure cleanup)
+
+    Example:
+        >>> with popen_in_project_root(cmd, stdout=subprocess.PIPE, text=True) as proc:
+        ...     for line in proc.stdout:
+        ...         print(line, end="")
+    """
+    kwargs.setdefault("cwd", PROJECT_ROOT)
+
+    return subprocess.Popen(command, **kwargs)
@@ -0,0 +1,70 @@
+"""
+PyYAML loader/dumper selection.
+
+The libyaml-backed CSafeLoader/CSafeDumper parse and emit several times faster
+than the pure-Python SafeLoader/SafeDumper. They're used whenever PyYAML was
+built against libyaml; otherwise the pure-Python classes are used and a
+warning is logged once per session.
+
+PyYAML itself is optional: callers check YAML_AVAILABLE first.
+"""
+
+import functools
+from typing import IO, Any
+
+from clingy.core.logger import log_warning
+
+try:
+    import yaml
+
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+LIBYAML_AVAILABLE = False
+if YAML_AVAILABLE:
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+
+        LIBYAML_AVAILABLE = True
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+
+@functools.lru_cache(maxsize=1)
+def _warn_pure_python() -> None:
+    """Log (once) that YAML goes through the slow pure-Python implementation"""
+    log_warning(
+        "PyYAML was built without libyaml; using the slower pure-Python loader. "
+        "Install libyaml (e.g. libyaml-dev) and reinstall PyYAML to speed it up"
+    )
+
+
+def safe_load(stream: IO) -> Any:
+    """
+    Parse YAML with the fastest available safe loader
+
+    Args:
+        stream: Open file (or string) with YAML content
+
+    Returns:
+        Parsed data (None for an empty document)
+    """
+    if not LIBYAML_AVAILABLE:
+        _warn_pure_python()
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: IO, **kwargs) -> None:
+    """
+    Write data as YAML with the fastest available safe dumper
+
+    Args:
+        data: Plain data (dicts, lists, scalars) to serialize
+        stream: Open file to write to
+        **kwargs: Extra yaml.dump options (default_flow_style, sort_keys, ...)
+    """
+    if not LIBYAML_AVAILABLE:
+        _warn_pure_python()
+    yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -3,29 +3,38 @@ Pytest configuration and shared fixtures
 """
 
 import json
+import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 
 import pytest
 
+# RAM-backed filesystem used for tmp_path on Linux (see pytest_configure)
+_SHM_DIR = "/dev/shm"
 
-@pytest.fixture
-def temp_project(tmp_path):
-    """
-    Create a temporary manager project structure.
+# basetemp created by pytest_configure, removed again in pytest_unconfigure
+_shm_basetemp = None
 
-    Returns:
-        Path: Root directory of the temporary project
-    """
-    project = tmp_path / "test-project"
-    project.mkdir()
+# Files rewritten in place by code under test (InitCommand rewrites .clingy),
+# so per-test copies must not share their inode with the session template
+_UNSHARED_FILES = {".clingy"}
 
-    # Create commands directory
-    commands_dir = project / "commands"
-    commands_dir.mkdir()
-    (commands_dir / "__init__.py").write_text("")
+# Session template files are read-only, so a write through a hardlink fails
+# loudly instead of changing the template for every later test. Root ignores
+# file modes, so hardlinks are only used when the mode is enforced.
+_TEMPLATE_FILE_MODE = 0o444
+_COPIED_FILE_MODE = 0o644
+_HARDLINK_TEMPLATE = hasattr(os, "geteuid") and os.geteuid() != 0
 
-    # Create config.py
-    config_content = '''"""Test project configuration"""
+# .clingy marker written into every test project
+_MARKER_CONTENT = (
+    json.dumps({"version": "1.0", "type": "clingy-project", "template": "test"}, indent=2) + "\n"
+)
+
+# config.py written into every test project
+_CONFIG_CONTENT = '''"""Test project configuration"""
 
 PROJECT_NAME = "Test Project"
 PROJECT_VERSION = "1.0.0"
@@ -42,24 +51,9 @@ DEPENDENCIES = [
     ),
 ]
 '''
-    (project / "config.py").write_text(config_content)
 
-    # Create .clingy marker file
-    marker_content = {"version": "1.0", "type": "clingy-project", "template": "test"}
-    (project / ".clingy").write_text(json.dumps(marker_content, indent=2) + "\n")
-
-    return project
-
-
-@pytest.fixture
-def temp_project_with_command(temp_project):
-    """
-    Create a temporary project with a sample command.
-
-    Returns:
-        Path: Root directory of the project with a command
-    """
-    command_content = '''"""Sample test command"""
+# Sample command added by temp_project_with_command
+_COMMAND_CONTENT = '''"""Sample test command"""
 from argparse import ArgumentParser, Namespace
 from clingy.commands.base import BaseCommand
 from clingy.core.menu import MenuNode
@@ -90,10 +84,169 @@ class TestCommand(BaseCommand):
         )
 '''
 
-    commands_dir = temp_project / "commands"
-    (commands_dir / "test_command.py").write_text(command_content)
 
-    return temp_project
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Put tmp_path directories on tmpfs when available.
+
+    The suite is dominated by small mkdir/write calls; on /dev/shm they never
+    touch the disk. An explicit --basetemp always wins. Each run gets its own
+    directory, so concurrent runs (other checkouts, CI jobs) never delete each
+    other's trees; pytest_unconfigure frees it when the run ends.
+    """
+    global _shm_basetemp
+
+    if config.option.basetemp or sys.platform != "linux":
+        return
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        _shm_basetemp = tempfile.mkdtemp(dir=_SHM_DIR, prefix="clingy-tests-")
+        config.option.basetemp = _shm_basetemp
+
+
+def pytest_unconfigure(config):
+    """
+    Remove the per-run tmpfs basetemp created by pytest_configure.
+    """
+    global _shm_basetemp
+
+    if _shm_basetemp is not None:
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
+        _shm_basetemp = None
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    copytree copy_function: hardlink template files into a per-test project.
+
+    Adding, unlinking or replacing files never affects the template; writing
+    into a linked file raises PermissionError because the template is
+    read-only (see _freeze_template). Files in _UNSHARED_FILES, root and
+    filesystems without hardlinks get a writable copy.
+    """
+    if _HARDLINK_TEMPLATE and os.path.basename(src) not in _UNSHARED_FILES:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    os.chmod(dst, _COPIED_FILE_MODE)
+
+
+def _freeze_template(project: Path) -> None:
+    """
+    Make every file of a session template project read-only.
+
+    Args:
+        project: Template project root directory
+    """
+    for path in project.rglob("*"):
+        if path.is_file():
+            path.chmod(_TEMPLATE_FILE_MODE)
+
+
+def _build_template_project(project: Path) -> None:
+    """
+    Write the canonical test project tree (commands/, config.py, .clingy).
+
+    Args:
+        project: Directory to create the project in
+    """
+    project.mkdir()
+
+    # Create commands directory
+    commands_dir = project / "commands"
+    commands_dir.mkdir()
+    (commands_dir / "__init__.py").write_text("")
+
+    # Create config.py
+    (project / "config.py").write_text(_CONFIG_CONTENT)
+
+    # Create .clingy marker file
+    (project / ".clingy").write_text(_MARKER_CONTENT)
+
+
+def _add_template_command(project: Path) -> None:
+    """
+    Add the sample TestCommand to a project built by _build_template_project.
+
+    Args:
+        project: Project root directory
+    """
+    (project / "commands" / "test_command.py").write_text(_COMMAND_CONTENT)
+
+
+@pytest.fixture(scope="session")
+def _template_project(tmp_path_factory):
+    """
+    Build the canonical project tree once per session.
+
+    Tests never use it directly: temp_project copies it into tmp_path.
+
+    Returns:
+        Path: Root directory of the template project
+    """
+    project = tmp_path_factory.mktemp("clingy-base") / "test-project"
+    _build_template_project(project)
+    _freeze_template(project)
+    return project
+
+
+@pytest.fixture(scope="session")
+def _template_project_with_command(tmp_path_factory, _template_project):
+    """
+    Build the template project plus the sample command once per session.
+
+    Returns:
+        Path: Root directory of the template project with a command
+    """
+    project = tmp_path_factory.mktemp("clingy-base-cmd") / "test-project"
+    shutil.copytree(_template_project, project)
+    _add_template_command(project)
+    _freeze_template(project)
+    return project
+
+
+@pytest.fixture
+def temp_project(tmp_path, _template_project):
+    """
+    Create a temporary manager project structure.
+
+    Returns:
+        Path: Root directory of the temporary project
+    """
+    project = tmp_path / "test-project"
+    shutil.copytree(_template_project, project, copy_function=_link_or_copy)
+    return project
+
+
+@pytest.fixture
+def temp_project_with_command(tmp_path, _template_project_with_command):
+    """
+    Create a temporary project with a sample command.
+
+    Returns:
+        Path: Root directory of the project with a command
+    """
+    project = tmp_path / "test-project"
+    shutil.copytree(_template_project_with_command, project, copy_function=_link_or_copy)
+    return project
+
+
+@pytest.fixture(scope="session")
+def discovered_commands():
+    """
+    Discover the framework commands once per session.
+
+    Tests must only read the returned dict.
+
+    Returns:
+        dict: Command names mapped to command classes
+    """
+    from clingy.commands import discover_commands
+
+    return discover_commands()
 
 
 @pytest.fixture
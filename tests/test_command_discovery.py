@@ -6,26 +6,23 @@ from pathlib import Path
 
 import pytest
 
-from clingy.commands import discover_commands
 from clingy.commands.base import BaseCommand
 
 
 class TestDiscoverCommands:
     """Tests for discover_commands function"""
 
-    def test_discovers_framework_commands(self):
+    def test_discovers_framework_commands(self, discovered_commands):
         """Should discover framework commands (e.g., init)"""
-        commands = discover_commands()
+        commands = discovered_commands
 
         assert "init" in commands
         assert issubclass(commands["init"], BaseCommand)
 
     def test_discovers_project_commands(self, temp_project_with_command, monkeypatch):
         """Should discover commands from project directory"""
-        # Add project commands dir to path
-        import sys
-
-        sys.path.insert(0, str(temp_project_with_command))
+        # Add project dir to path (restored after the test)
+        monkeypatch.syspath_prepend(str(temp_project_with_command))
 
         # Import and discover from project
         commands_dir = temp_project_with_command / "commands"
@@ -48,9 +45,9 @@ class TestDiscoverCommands:
         assert issubclass(module.TestCommand, BaseCommand)
         assert module.TestCommand.name == "test"
 
-    def test_returns_dict_of_commands(self):
+    def test_returns_dict_of_commands(self, discovered_commands):
         """Should return a dictionary mapping names to classes"""
-        commands = discover_commands()
+        commands = discovered_commands
 
         assert isinstance(commands, dict)
         assert len(commands) > 0
@@ -59,9 +56,9 @@ class TestDiscoverCommands:
             assert isinstance(name, str)
             assert issubclass(cmd_class, BaseCommand)
 
-    def test_command_has_required_attributes(self):
+    def test_command_has_required_attributes(self, discovered_commands):
         """Discovered commands should have required attributes"""
-        commands = discover_commands()
+        commands = discovered_commands
 
         for name, cmd_class in commands.items():
             # Check class attributes
@@ -99,9 +96,9 @@ class AlsoNotACommand:
         # (In practice, discover_commands scans specific directory)
         # This test verifies the logic conceptually
 
-    def test_ignores_abstract_base_command(self):
+    def test_ignores_abstract_base_command(self, discovered_commands):
         """Should not include BaseCommand itself"""
-        commands = discover_commands()
+        commands = discovered_commands
 
         # BaseCommand should not be in discovered commands
         assert "base" not in commands
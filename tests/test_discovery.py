@@ -2,6 +2,7 @@
 Tests for context detection and project discovery
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,9 @@ from clingy.core.discovery import (
     load_project_config,
 )
 
+# .clingy marker without a template field
+_MARKER_CONTENT = json.dumps({"version": "1.0", "type": "clingy-project"}, indent=2) + "\n"
+
 
 class TestFindManagerRoot:
     """Tests for find_clingy_root function"""
@@ -110,16 +114,12 @@ class TestValidProjectDetection:
 
     def test_empty_commands_directory(self, tmp_path):
         """Should find project even if commands/ is empty"""
-        import json
-
         project = tmp_path / "project"
         project.mkdir()
         (project / "commands").mkdir()
         (project / "commands" / "__init__.py").write_text("")
         (project / "config.py").write_text("PROJECT_NAME = 'Test'")
-        (project / ".clingy").write_text(
-            json.dumps({"version": "1.0", "type": "clingy-project"}, indent=2) + "\n"
-        )
+        (project / ".clingy").write_text(_MARKER_CONTENT)
 
         result = find_clingy_root(start_path=project)
         assert result == project
@@ -7,137 +7,97 @@ from pathlib import Path
 
 import pytest
 
-from clingy.commands.init import InitCommand
 
+@pytest.fixture
+def init_cmd():
+    """
+    Create an InitCommand (imported here so collection doesn't load the framework).
 
-class TestInitCommand:
-    """Tests for InitCommand"""
-
-    def test_creates_project_structure(self, tmp_path):
-        """Should create commands/ and config.py"""
-        init_cmd = InitCommand()
-
-        # Change to temp directory
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            # Execute init
-            args = Namespace(force=False, template="basic", update=False)
-            result = init_cmd.execute(args)
-
-            # Verify success
-            assert result is True
+    Returns:
+        InitCommand: Fresh command instance
+    """
+    from clingy.commands.init import InitCommand
 
-            # Verify structure
-            assert (tmp_path / "commands").exists()
-            assert (tmp_path / "commands" / "__init__.py").exists()
-            assert (tmp_path / "config.py").exists()
+    return InitCommand()
 
-        finally:
-            os.chdir(original_cwd)
 
-    def test_creates_template_basic(self, tmp_path):
-        """Should create basic template with example commands"""
-        init_cmd = InitCommand()
+@pytest.fixture
+def in_tmp(tmp_path, monkeypatch):
+    """
+    Run the test with tmp_path as the current directory.
 
-        import os
+    Returns:
+        Path: The (empty) current directory
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
 
-        try:
-            args = Namespace(force=False, template="basic", update=False)
-            result = init_cmd.execute(args)
-
-            assert result is True
-
-            # Verify template files exist
-            commands_dir = tmp_path / "commands"
-            assert (commands_dir / "greet.py").exists()
-            assert (commands_dir / "info.py").exists()
-            assert (commands_dir / "calculator.py").exists()
-
-        finally:
-            os.chdir(original_cwd)
+class TestInitCommand:
+    """Tests for InitCommand"""
 
-    def test_fails_if_project_already_exists(self, temp_project):
+    @pytest.mark.parametrize(
+        "template, expected, created",
+        [
+            (
+                "basic",
+                True,
+                [
+                    "commands/__init__.py",
+                    "config.py",
+                    "commands/greet.py",
+                    "commands/info.py",
+                    "commands/calculator.py",
+                ],
+            ),
+            # Should fail gracefully without creating a partial structure
+            ("nonexistent-template", False, []),
+        ],
+    )
+    def test_init_in_empty_directory(self, init_cmd, in_tmp, template, expected, created):
+        """Should create the template's structure, or nothing for an invalid template"""
+        args = Namespace(force=False, template=template, update=False)
+        result = init_cmd.execute(args)
+
+        assert result is expected
+        assert (in_tmp / "commands").exists() is expected
+        for path in created:
+            assert (in_tmp / path).exists(), path
+
+    def test_fails_if_project_already_exists(self, init_cmd, temp_project, monkeypatch):
         """Should fail if commands/ already exists (without --force)"""
-        init_cmd = InitCommand()
-
-        import os
+        monkeypatch.chdir(temp_project)
 
-        original_cwd = os.getcwd()
-        os.chdir(temp_project)
+        args = Namespace(force=False, template="basic", update=False)
+        result = init_cmd.execute(args)
 
-        try:
-            args = Namespace(force=False, template="basic", update=False)
-            result = init_cmd.execute(args)
+        # Should fail because project already exists
+        assert result is False
 
-            # Should fail because project already exists
-            assert result is False
-
-        finally:
-            os.chdir(original_cwd)
-
-    def test_force_flag_overwrites_existing(self, temp_project):
+    def test_force_flag_overwrites_existing(self, init_cmd, temp_project, monkeypatch):
         """Should overwrite existing project with --force"""
-        init_cmd = InitCommand()
-
         # Add a custom file to commands/
         custom_file = temp_project / "commands" / "custom.py"
         custom_file.write_text("# Custom command")
 
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(temp_project)
-
-        try:
-            args = Namespace(force=True, template="basic", update=False)
-            result = init_cmd.execute(args)
-
-            assert result is True
-
-            # Custom file should be gone (commands/ was recreated)
-            assert not custom_file.exists()
-
-            # Template files should exist
-            assert (temp_project / "commands" / "greet.py").exists()
-
-        finally:
-            os.chdir(original_cwd)
-
-    def test_invalid_template_fails(self, tmp_path):
-        """Should fail gracefully for invalid template name"""
-        init_cmd = InitCommand()
-
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
+        monkeypatch.chdir(temp_project)
 
-        try:
-            args = Namespace(force=False, template="nonexistent-template", update=False)
-            result = init_cmd.execute(args)
+        args = Namespace(force=True, template="basic", update=False)
+        result = init_cmd.execute(args)
 
-            # Should fail
+        assert result is True
 
-            # Should not create partial structure
-            assert not (tmp_path / "commands").exists()
+        # Custom file should be gone (commands/ was recreated)
+        assert not custom_file.exists()
 
-        finally:
-            os.chdir(original_cwd)
+        # Template files should exist
+        assert (temp_project / "commands" / "greet.py").exists()
 
-    def test_command_has_correct_name(self):
+    def test_command_has_correct_name(self, init_cmd):
         """Command should have name 'init'"""
-        init_cmd = InitCommand()
         assert init_cmd.name == "init"
 
-    def test_command_has_help_text(self):
+    def test_command_has_help_text(self, init_cmd):
         """Command should have help text"""
-        init_cmd = InitCommand()
         assert init_cmd.help is not None
         assert len(init_cmd.help) > 0